@@ -1,3 +1,9 @@
+"""
+Feature selection helpers: low variance, high correlation and model importance filters.
+
+Input DataFrames and Series are treated as read-only; every function returns a new
+DataFrame (or the input itself when nothing is removed) instead of modifying its argument.
+"""
 import pandas as pd
 import numpy as np
 import logging
@@ -140,7 +146,8 @@ def select_by_model_importance(
         df: pd.DataFrame,
         target_series: pd.Series,
         task_type: str,
-        threshold: float = 0.01) -> pd.DataFrame:
+        threshold: float = 0.01,
+        n_estimators: int = 100) -> pd.DataFrame:
     """
     Selects features based on importance from a tree-based model.
     (Existing docstring and code)
@@ -164,17 +171,14 @@ def select_by_model_importance(
         raise ValueError(
             "Input 'threshold' must be a numeric value between 0 and 1.")
 
-    X = df.copy()
-    y = target_series.copy()  # y is already aligned with X from the caller
-
-    if X.empty or y.empty:
+    # Short-circuit before copying or fitting anything
+    if target_series.empty:
         logging.warning(
-            "select_by_model_importance: DataFrame or target is empty. Returning original DataFrame.")
-        # Log this specific scenario
-        return df  # Return original df structure if X became empty
+            "select_by_model_importance: Target series is empty. Returning original DataFrame.")
+        return df
 
-    numeric_features = X.select_dtypes(include=np.number).columns.tolist()
-    non_numeric_features = X.select_dtypes(exclude=np.number).columns.tolist()
+    numeric_features = df.select_dtypes(include=np.number).columns.tolist()
+    non_numeric_features = df.select_dtypes(exclude=np.number).columns.tolist()
 
     if not numeric_features:
         logging.warning(
@@ -186,9 +190,9 @@ def select_by_model_importance(
                 f"Parameters: task_type='{task_type}', threshold={threshold}\n")
             f.write(
                 "Action: No numeric features for model training. No features selected/removed by model. Non-numeric features kept.\n\n")
-        return X  # Return X as is, which contains numeric + non-numeric potentially
+        return df  # Return df as is, which contains numeric + non-numeric potentially
 
-    X_numeric = X[numeric_features]
+    X_numeric = df[numeric_features]
     imputer = SimpleImputer(strategy='median')
     X_imputed_np = imputer.fit_transform(X_numeric)
     X_imputed_df = pd.DataFrame(
@@ -196,12 +200,12 @@ def select_by_model_importance(
 
     if task_type == 'classification':
         model = RandomForestClassifier(
-            random_state=42, n_estimators=100, n_jobs=-1)
+            random_state=42, n_estimators=n_estimators, n_jobs=-1)
     else:  # regression
         model = RandomForestRegressor(
-            random_state=42, n_estimators=100, n_jobs=-1)
+            random_state=42, n_estimators=n_estimators, n_jobs=-1)
 
-    model.fit(X_imputed_df, y)
+    model.fit(X_imputed_df, target_series)  # already aligned with df by the caller
     importances = pd.Series(model.feature_importances_,
                             index=X_imputed_df.columns)
     features_to_drop_model = importances[importances <
@@ -250,7 +254,8 @@ def run_feature_selection(
         task_type: str,
         low_variance_threshold: float = 0.01,
         correlation_threshold: float = 0.9,
-        importance_threshold: float = 0.01):
+        importance_threshold: float = 0.01,
+        n_estimators: int = 100):
     """
     Runs a pipeline of feature selection methods and saves the result.
 
@@ -262,6 +267,7 @@ def run_feature_selection(
         low_variance_threshold (float): Threshold for remove_low_variance.
         correlation_threshold (float): Threshold for remove_highly_correlated.
         importance_threshold (float): Threshold for select_by_model_importance.
+        n_estimators (int): Number of trees in the random forest used by select_by_model_importance.
     """
     try:
         df = pd.read_csv(input_path)
@@ -354,7 +360,8 @@ def run_feature_selection(
 
     # 3. Select by Model Importance
     X_after_importance = select_by_model_importance(
-        X_after_corr, y, task_type, threshold=importance_threshold)
+        X_after_corr, y, task_type, threshold=importance_threshold,
+        n_estimators=n_estimators)
     imp_removed_count = X_after_corr.shape[1] - X_after_importance.shape[1]
     summary_log.append(
         f"After select_by_model_importance: {X_after_importance.shape[1]} features remaining. ({imp_removed_count} removed)")
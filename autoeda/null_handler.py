@@ -1,7 +1,7 @@
 import pandas as pd
 import numpy as np
 import os
-from typing import Dict, Callable
+from typing import Dict, Callable, MutableSequence
 import logging
 
 logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
@@ -9,12 +9,26 @@ logging.basicConfig(level=logging.INFO, format='[%(levelname)s] %(message)s')
 # --------------*NULL HANDLING STRATEGIES*------------------
 
 
+def _with_fill_category(series: pd.Series, value) -> pd.Series:
+    # fillna on a categorical column only accepts existing categories
+    if isinstance(series.dtype, pd.CategoricalDtype) and value not in series.cat.categories:
+        return series.cat.add_categories([value])
+    return series
+
+
 def drop_nulls(df: pd.DataFrame) -> pd.DataFrame:
     return df.dropna()
 
 
 def replace_with_fixed(df: pd.DataFrame, value=0) -> pd.DataFrame:
-    return df.fillna(value)
+    if df.select_dtypes(include="category").empty or not pd.api.types.is_scalar(value):
+        return df.fillna(value)
+    # Fill column by column so categoricals without nulls keep their categories
+    df_filled = df.copy()
+    for col in df.columns:
+        if df[col].isnull().any():
+            df_filled[col] = _with_fill_category(df_filled[col], value).fillna(value)
+    return df_filled
 
 
 def replace_with_mean(df: pd.DataFrame) -> pd.DataFrame:
@@ -39,7 +53,8 @@ def replace_with_mode(df: pd.DataFrame) -> pd.DataFrame:
             if not mode_val.empty:
                 df_filled[col] = df_filled[col].fillna(mode_val.iloc[0])
             elif df[col].dtype in ['object', 'category']:
-                df_filled[col] = df_filled[col].fillna("Unknown")
+                df_filled[col] = _with_fill_category(
+                    df_filled[col], "Unknown").fillna("Unknown")
             else:
                 df_filled[col] = df_filled[col].fillna(0)
     return df_filled
@@ -58,7 +73,7 @@ def backward_fill(df: pd.DataFrame) -> pd.DataFrame:
 def evaluate_methods(original_df: pd.DataFrame,
                      cleaned_versions: Dict[str,
                                             pd.DataFrame],
-                     log_lines: list) -> str:
+                     log_lines: MutableSequence[str]) -> str:
     original_nulls = original_df.isnull().sum().sum()
     original_shape = original_df.shape
     best_score = float("-inf")
@@ -89,27 +104,8 @@ def evaluate_methods(original_df: pd.DataFrame,
 # ------------------------* MAIN ENTRYPOINT *-------------------------------
 
 
-def process_csv(input_path: str, output_path: str) -> None:
-    if not os.path.exists(input_path):
-        logging.error(f"Input file not found: {input_path}")
-        return
-
-    try:
-        df = pd.read_csv(input_path)
-    except Exception as e:
-        logging.error(f"Failed to read CSV: {e}")
-        return
-
-    if df.empty:
-        logging.warning("Input CSV is empty. No processing done.")
-        return
-
-    logging.info(f"Input CSV loaded: {input_path}")
-    logging.info(
-        f"Initial Shape: {df.shape}, Null Count: {df.isnull().sum().sum()}")
-
-    log_lines = []
-    log_lines.append(f"Processing file: {input_path}")
+def process_df(df: pd.DataFrame,
+               log_lines: MutableSequence[str]) -> pd.DataFrame:
     log_lines.append(f"Initial shape: {df.shape}")
     log_lines.append(f"Total null values: {df.isnull().sum().sum()}\n")
 
@@ -134,6 +130,30 @@ def process_csv(input_path: str, output_path: str) -> None:
         f"Cleaned Data Shape: {
             best_df.shape}, Nulls Remaining: {
             best_df.isnull().sum().sum()}")
+    return best_df
+
+
+def process_csv(input_path: str, output_path: str) -> None:
+    if not os.path.exists(input_path):
+        logging.error(f"Input file not found: {input_path}")
+        return
+
+    try:
+        df = pd.read_csv(input_path)
+    except Exception as e:
+        logging.error(f"Failed to read CSV: {e}")
+        return
+
+    if df.empty:
+        logging.warning("Input CSV is empty. No processing done.")
+        return
+
+    logging.info(f"Input CSV loaded: {input_path}")
+    logging.info(
+        f"Initial Shape: {df.shape}, Null Count: {df.isnull().sum().sum()}")
+
+    log_lines = [f"Processing file: {input_path}"]
+    best_df = process_df(df, log_lines)
 
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
     best_df.to_csv(output_path, index=False)
@@ -17,7 +17,8 @@ def apply_pca(df, n_components=None):
             - Metadata containing explained variance and column mappings
     """
 
-    numeric_df = df.select_dtypes(include=["float64", "int64"])
+    # Any numeric width, so float32/int8 columns from data_optimizer are kept
+    numeric_df = df.select_dtypes(include="number")
     pca = PCA(n_components=n_components)
     components = pca.fit_transform(numeric_df)
 
@@ -15,6 +15,8 @@ def load_and_clean_data(file_path, encoding):
     """
     try:
         df = pd.read_csv(file_path, encoding=encoding)
+    except UnicodeDecodeError:
+        raise  # already a ValueError; lets callers retry with another encoding
     except Exception as e:
         raise ValueError(f"could not load file: {e}")
 
@@ -1,15 +1,10 @@
 import pytest
 import pandas as pd
 import numpy as np
-import tempfile
-import os
+from collections import deque
 from pandas import testing as tm
-from autoeda import null_handler 
-# Assuming autoeda is in PYTHONPATH or installed
-# If autoeda is a local directory and not installed, Python might not find it
-# without adjusting sys.path. For now, let's assume it's discoverable.
-
-# Specifically import all functions to be tested
+# autoeda/ is a package, so pytest's rootdir insertion puts the repo root on sys.path;
+# no path manipulation or conftest.py is needed.
 from autoeda.null_handler import (
     drop_nulls,
     replace_with_fixed,
@@ -19,60 +14,121 @@ from autoeda.null_handler import (
     forward_fill,
     backward_fill,
     evaluate_methods,
+    process_df,
     process_csv
 )
 
+# Expected mixed_nulls_df columns after ffill/bfill; assert_series_equal never mutates them.
+_EXP_FFILL_A_NUM = pd.Series([1.0, 1.0, 3.0, 4.0, 5.0], name='A_num')
+_EXP_FFILL_C_NUM = pd.Series([10.0, 20.0, 20.0, 20.0, 50.0], name='C_num_with_nan')
+_EXP_BFILL_A_NUM = pd.Series([1.0, 3.0, 3.0, 4.0, 5.0], name='A_num')
+_EXP_BFILL_C_NUM = pd.Series([10.0, 20.0, 50.0, 50.0, 50.0], name='C_num_with_nan')
+# Expected all_null_column_df['mixed_col'] after ffill/bfill; object dtype is part of the check.
+_EXP_FFILL_MIXED_COL = pd.Series([1, 1, 'a'], name='mixed_col', dtype=object)
+_EXP_BFILL_MIXED_COL = pd.Series([1, 'a', 'a'], name='mixed_col', dtype=object)
+
 # region Fixtures
-@pytest.fixture
+# Fixtures are built once per module and shared; the strategies never modify their input (see test_does_not_mutate_input).
+@pytest.fixture(scope="module")
 def empty_df():
     """DataFrame that is completely empty."""
     return pd.DataFrame()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def no_nulls_df():
     """DataFrame with no null values."""
-    data = {'col_a': [1, 2, 3], 'col_b': ['x', 'y', 'z'], 'col_c': [4.0, 5.1, 6.2]}
+    data = {'col_a': np.array([1, 2, 3], dtype=np.int64),
+            'col_b': pd.Categorical(['x', 'y', 'z']),
+            'col_c': np.array([4.0, 5.1, 6.2], dtype=np.float64)}
     return pd.DataFrame(data)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def numeric_nulls_df():
     """DataFrame with nulls only in numeric columns."""
-    data = {'num_col1': [1.0, np.nan, 3.0, np.nan],
-            'num_col2': [np.nan, 2.2, 3.3, 4.4],
-            'cat_col1': ['a', 'b', 'c', 'd']}
+    data = {'num_col1': np.array([1.0, np.nan, 3.0, np.nan], dtype=np.float64),
+            'num_col2': np.array([np.nan, 2.2, 3.3, 4.4], dtype=np.float64),
+            'cat_col1': np.array(['a', 'b', 'c', 'd'], dtype=object)}
     return pd.DataFrame(data)
 
-@pytest.fixture
-def categorical_nulls_df():
-    """DataFrame with nulls only in categorical columns."""
-    data = {'num_col1': [1.0, 2.0, 3.0, 4.0],
-            'cat_col1': ['a', np.nan, 'c', np.nan],
-            'cat_col2': [np.nan, 'x', 'y', 'z']}
+@pytest.fixture(scope="module", params=["category", "object"])
+def categorical_nulls_df(request):
+    """DataFrame with nulls only in categorical columns, once as pd.Categorical and once as the object strings pd.read_csv gives."""
+    data = {'num_col1': np.array([1.0, 2.0, 3.0, 4.0], dtype=np.float64),
+            'cat_col1': pd.Series(['a', np.nan, 'c', np.nan], dtype=request.param),
+            'cat_col2': pd.Series([np.nan, 'x', 'y', 'z'], dtype=request.param)}
     return pd.DataFrame(data)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def all_null_column_df():
     """DataFrame with at least one column containing all nulls."""
-    data = {'num_col_all_null': [np.nan, np.nan, np.nan],
-            'cat_col_all_null': [np.nan, np.nan, np.nan],
-            'mixed_col': [1, np.nan, 'a']}
+    data = {'num_col_all_null': np.full(3, np.nan, dtype=np.float64),
+            'cat_col_all_null': np.full(3, np.nan, dtype=np.float64),
+            'mixed_col': np.array([1, np.nan, 'a'], dtype=object)}
     return pd.DataFrame(data)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mixed_nulls_df():
     """DataFrame with a mix of numeric and categorical columns, and nulls in various places."""
-    data = {'A_num': [1.0, np.nan, 3.0, 4.0, 5.0],
-            'B_cat': ['apple', 'banana', np.nan, 'cherry', 'banana'],
-            'C_num_with_nan': [10.0, 20.0, np.nan, np.nan, 50.0],
-            'D_cat_with_nan': [None, 'dog', 'cat', None, 'dog'],
-            'E_all_nan_numeric': [np.nan, np.nan, np.nan, np.nan, np.nan],
-            'F_all_nan_cat': [np.nan, np.nan, np.nan, np.nan, np.nan]}
+    data = {'A_num': np.array([1.0, np.nan, 3.0, 4.0, 5.0], dtype=np.float64),
+            'B_cat': pd.Categorical(['apple', 'banana', np.nan, 'cherry', 'banana']),
+            'C_num_with_nan': np.array([10.0, 20.0, np.nan, np.nan, 50.0], dtype=np.float64),
+            'D_cat_with_nan': pd.Categorical([None, 'dog', 'cat', None, 'dog']),
+            'E_all_nan_numeric': np.full(5, np.nan, dtype=np.float32),
+            'F_all_nan_cat': pd.Categorical.from_codes([-1] * 5, categories=['a'])}
     return pd.DataFrame(data)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def mixed_nulls_meta():
+    """Literal sizes of mixed_nulls_df; update together with the fixture above."""
+    return {"E_all_nan_len": 5, "F_all_nan_len": 5}
+
+@pytest.fixture(scope="module")
 def all_nan_object_col_df():
     """DataFrame with a single column of object dtype that is all NaN."""
-    return pd.DataFrame({'obj_all_nan': pd.Series([np.nan, np.nan, np.nan], dtype=object)})
+    return pd.DataFrame({'obj_all_nan': np.full(3, np.nan, dtype=object)})
+
+def _expected_fills(df):
+    """Per-column mean, median and first mode of a fixture, as the fill strategies compute them."""
+    modes = {}
+    for col in df.columns:
+        mode = df[col].mode()
+        if not mode.empty:
+            modes[col] = mode.iloc[0]
+    return {"mean": df.mean(numeric_only=True),
+            "median": df.median(numeric_only=True),
+            "mode": modes}
+
+# Expected fill values, computed once per module instead of inside every test
+@pytest.fixture(scope="module")
+def numeric_nulls_expected(numeric_nulls_df):
+    return _expected_fills(numeric_nulls_df)
+
+@pytest.fixture(scope="module")
+def categorical_nulls_expected(categorical_nulls_df):
+    return _expected_fills(categorical_nulls_df)
+
+@pytest.fixture(scope="module")
+def all_null_column_expected(all_null_column_df):
+    return _expected_fills(all_null_column_df)
+
+@pytest.fixture(scope="module")
+def mixed_nulls_expected(mixed_nulls_df):
+    return _expected_fills(mixed_nulls_df)
+
+@pytest.fixture(scope="module")
+def mixed_modes(mixed_nulls_expected):
+    """First mode of every mixed_nulls_df column that has one (the all-NaN columns are absent)."""
+    return mixed_nulls_expected["mode"]
+
+@pytest.fixture(scope="module")
+def mixed_nulls_null_counts(mixed_nulls_df):
+    """Per-column null counts of mixed_nulls_df, for tests that check some nulls were left alone."""
+    return mixed_nulls_df.isna().sum()
+
+@pytest.fixture(scope="module")
+def mixed_nulls_total_nulls(mixed_nulls_null_counts):
+    """Total null count of mixed_nulls_df, derived from the per-column counts."""
+    return int(mixed_nulls_null_counts.sum())
 
 # endregion Fixtures
 
@@ -80,16 +136,16 @@ def all_nan_object_col_df():
 def test_drop_nulls_with_numeric_nulls(numeric_nulls_df):
     """Test drop_nulls with nulls in numeric columns."""
     original_shape = numeric_nulls_df.shape
-    cleaned_df = drop_nulls(numeric_nulls_df.copy())
-    assert cleaned_df.isnull().sum().sum() == 0
+    cleaned_df = drop_nulls(numeric_nulls_df)
+    assert not cleaned_df.isna().any(axis=None)
     assert cleaned_df.shape[0] < original_shape[0] # Rows should be dropped
     assert cleaned_df.shape[1] == original_shape[1] # Columns should remain the same
 
 def test_drop_nulls_with_categorical_nulls(categorical_nulls_df):
     """Test drop_nulls with nulls in categorical columns."""
     original_shape = categorical_nulls_df.shape
-    cleaned_df = drop_nulls(categorical_nulls_df.copy())
-    assert cleaned_df.isnull().sum().sum() == 0
+    cleaned_df = drop_nulls(categorical_nulls_df)
+    assert not cleaned_df.isna().any(axis=None)
     assert cleaned_df.shape[0] < original_shape[0]
     assert cleaned_df.shape[1] == original_shape[1]
 
@@ -108,310 +164,257 @@ def test_drop_nulls_with_all_null_column(all_null_column_df):
     # Expected: row 1 (1, nan, nan) -> nan in mixed_col, nan in all_null cols -> dropped
     # row 2 (nan, nan, nan) -> all nan -> dropped.
     # So the resulting df should be empty.
-    cleaned_df = drop_nulls(all_null_column_df.copy())
+    cleaned_df = drop_nulls(all_null_column_df)
     assert cleaned_df.empty # All rows should be dropped
 
 def test_drop_nulls_with_mixed_nulls(mixed_nulls_df):
     """Test drop_nulls with a mix of nulls."""
     original_shape = mixed_nulls_df.shape
-    cleaned_df = drop_nulls(mixed_nulls_df.copy())
-    assert cleaned_df.isnull().sum().sum() == 0
+    cleaned_df = drop_nulls(mixed_nulls_df)
+    assert not cleaned_df.isna().any(axis=None)
     # In mixed_nulls_df, every row has at least one NaN, so all rows should be dropped.
     assert cleaned_df.empty
     assert cleaned_df.shape[0] < original_shape[0]
 
-def test_drop_nulls_on_empty_df(empty_df):
-    """Test drop_nulls on an already empty DataFrame."""
-    cleaned_df = drop_nulls(empty_df.copy())
-    assert cleaned_df.empty
-    assert cleaned_df.shape == (0,0)
-
-def test_drop_nulls_on_no_nulls_df(no_nulls_df):
-    """Test drop_nulls on a DataFrame with no nulls."""
-    original_df_copy = no_nulls_df.copy()
-    cleaned_df = drop_nulls(original_df_copy)
-    tm.assert_frame_equal(cleaned_df, no_nulls_df)
-    assert cleaned_df.shape == no_nulls_df.shape
-
 # endregion Tests for drop_nulls
 
 # region Tests for replace_with_fixed
 def test_replace_with_fixed_numeric_default(numeric_nulls_df):
     """Test replace_with_fixed on numeric nulls with default value (0)."""
-    df_copy = numeric_nulls_df.copy()
-    cleaned_df = replace_with_fixed(df_copy) # Default value is 0
-    assert cleaned_df.isnull().sum().sum() == 0
+    cleaned_df = replace_with_fixed(numeric_nulls_df) # Default value is 0
+    assert not cleaned_df.isna().any(axis=None)
     assert cleaned_df.shape == numeric_nulls_df.shape
     # Check if NaNs in numeric columns were replaced by 0
     assert (cleaned_df['num_col1'][[1, 3]] == 0).all()
     assert (cleaned_df['num_col2'][[0]] == 0).all()
     # Check non-null values remained
     assert cleaned_df['num_col1'][0] == numeric_nulls_df['num_col1'][0]
-    assert cleaned_df['cat_col1'].equals(numeric_nulls_df['cat_col1'])
+    assert np.array_equal(cleaned_df['cat_col1'].to_numpy(), numeric_nulls_df['cat_col1'].to_numpy())
 
 def test_replace_with_fixed_numeric_custom_value(numeric_nulls_df):
     """Test replace_with_fixed on numeric nulls with a custom value."""
-    df_copy = numeric_nulls_df.copy()
     custom_val = -99
-    cleaned_df = replace_with_fixed(df_copy, value=custom_val)
-    assert cleaned_df.isnull().sum().sum() == 0
+    cleaned_df = replace_with_fixed(numeric_nulls_df, value=custom_val)
+    assert not cleaned_df.isna().any(axis=None)
     assert cleaned_df.shape == numeric_nulls_df.shape
     assert (cleaned_df['num_col1'][[1, 3]] == custom_val).all()
     assert (cleaned_df['num_col2'][[0]] == custom_val).all()
 
 def test_replace_with_fixed_categorical_default(categorical_nulls_df):
     """Test replace_with_fixed on categorical nulls with default value (0)."""
-    # This will convert categorical columns with NaNs to mixed type if 0 is used,
-    # or object type. Pandas handles this by making the column dtype object.
-    df_copy = categorical_nulls_df.copy()
-    cleaned_df = replace_with_fixed(df_copy, value=0) # Default value
-    assert cleaned_df.isnull().sum().sum() == 0
+    # For categorical columns the fill value is added as a new category; either way the dtype is kept.
+    cleaned_df = replace_with_fixed(categorical_nulls_df, value=0) # Default value
+    assert not cleaned_df.isna().any(axis=None)
+    assert (cleaned_df.dtypes.map(str) == categorical_nulls_df.dtypes.map(str)).all()
     assert cleaned_df.shape == categorical_nulls_df.shape
     assert (cleaned_df['cat_col1'][[1, 3]] == 0).all()
     assert (cleaned_df['cat_col2'][[0]] == 0).all()
-    assert cleaned_df['num_col1'].equals(categorical_nulls_df['num_col1'])
+    assert np.array_equal(cleaned_df['num_col1'].to_numpy(), categorical_nulls_df['num_col1'].to_numpy(), equal_nan=True)
 
 def test_replace_with_fixed_categorical_custom_string(categorical_nulls_df):
     """Test replace_with_fixed on categorical nulls with a custom string value."""
-    df_copy = categorical_nulls_df.copy()
     custom_val = 'Unknown'
-    cleaned_df = replace_with_fixed(df_copy, value=custom_val)
-    assert cleaned_df.isnull().sum().sum() == 0
+    cleaned_df = replace_with_fixed(categorical_nulls_df, value=custom_val)
+    assert not cleaned_df.isna().any(axis=None)
     assert cleaned_df.shape == categorical_nulls_df.shape
     assert (cleaned_df['cat_col1'][[1, 3]] == custom_val).all()
     assert (cleaned_df['cat_col2'][[0]] == custom_val).all()
 
 def test_replace_with_fixed_mixed_nulls(mixed_nulls_df):
     """Test replace_with_fixed on mixed nulls with a specific value."""
-    df_copy = mixed_nulls_df.copy()
     custom_val = -1
-    cleaned_df = replace_with_fixed(df_copy, value=custom_val)
-    assert cleaned_df.isnull().sum().sum() == 0
+    cleaned_df = replace_with_fixed(mixed_nulls_df, value=custom_val)
+    assert not cleaned_df.isna().any(axis=None)
     assert cleaned_df.shape == mixed_nulls_df.shape
-    # Check a few specific replacements
-    assert cleaned_df.loc[1, 'A_num'] == custom_val
-    assert cleaned_df.loc[2, 'B_cat'] == custom_val # This will change dtype of B_cat
-    assert cleaned_df.loc[2, 'C_num_with_nan'] == custom_val
-    assert cleaned_df.loc[0, 'D_cat_with_nan'] == custom_val
+    # Compare whole columns; B_cat and D_cat stay categorical with the fill value added as a category
+    np.testing.assert_array_equal(cleaned_df['A_num'].to_numpy(), np.array([1.0, custom_val, 3.0, 4.0, 5.0]))
+    tm.assert_series_equal(cleaned_df['B_cat'],
+                           pd.Series(['apple', 'banana', custom_val, 'cherry', 'banana'], name='B_cat',
+                                     dtype=mixed_nulls_df['B_cat'].cat.add_categories([custom_val]).dtype))
+    np.testing.assert_array_equal(cleaned_df['C_num_with_nan'].to_numpy(),
+                                  np.array([10.0, 20.0, custom_val, custom_val, 50.0]))
+    tm.assert_series_equal(cleaned_df['D_cat_with_nan'],
+                           pd.Series([custom_val, 'dog', 'cat', custom_val, 'dog'], name='D_cat_with_nan',
+                                     dtype=mixed_nulls_df['D_cat_with_nan'].cat.add_categories([custom_val]).dtype))
     assert (cleaned_df['E_all_nan_numeric'] == custom_val).all()
     assert (cleaned_df['F_all_nan_cat'] == custom_val).all()
 
-def test_replace_with_fixed_empty_df(empty_df):
-    """Test replace_with_fixed on an empty DataFrame."""
-    cleaned_df = replace_with_fixed(empty_df.copy(), value=123)
-    assert cleaned_df.empty
-    tm.assert_frame_equal(cleaned_df, empty_df)
-
-def test_replace_with_fixed_no_nulls_df(no_nulls_df):
-    """Test replace_with_fixed on a DataFrame with no nulls."""
-    df_copy = no_nulls_df.copy()
-    cleaned_df = replace_with_fixed(df_copy, value=123)
-    tm.assert_frame_equal(cleaned_df, no_nulls_df)
-    assert cleaned_df.shape == no_nulls_df.shape
-
 # endregion Tests for replace_with_fixed
 
 # region Tests for replace_with_mean
-def test_replace_with_mean_numeric_nulls(numeric_nulls_df):
+def test_replace_with_mean_numeric_nulls(numeric_nulls_df, numeric_nulls_expected):
     """Test replace_with_mean on a DataFrame with only numeric nulls."""
-    df_copy = numeric_nulls_df.copy()
-    cleaned_df = replace_with_mean(df_copy)
+    cleaned_df = replace_with_mean(numeric_nulls_df)
 
-    assert cleaned_df.isnull().sum().sum() == 0 # All nulls should be filled
+    assert not cleaned_df.isna().any(axis=None) # All nulls should be filled
     assert cleaned_df.shape == numeric_nulls_df.shape # Shape should be preserved
 
     # Calculate expected means for columns with NaNs
-    mean_num_col1 = numeric_nulls_df['num_col1'].mean()
-    mean_num_col2 = numeric_nulls_df['num_col2'].mean()
+    mean_num_col1 = numeric_nulls_expected["mean"]['num_col1']
+    mean_num_col2 = numeric_nulls_expected["mean"]['num_col2']
 
     # Check that NaNs were replaced with the mean
     # Original: num_col1: [1.0, np.nan, 3.0, np.nan] -> mean is (1+3)/2 = 2.0
     # Original: num_col2: [np.nan, 2.2, 3.3, 4.4] -> mean is (2.2+3.3+4.4)/3 = 9.9/3 = 3.3
-    assert cleaned_df.loc[1, 'num_col1'] == pytest.approx(mean_num_col1)
-    assert cleaned_df.loc[3, 'num_col1'] == pytest.approx(mean_num_col1)
-    assert cleaned_df.loc[0, 'num_col2'] == pytest.approx(mean_num_col2)
+    assert cleaned_df['num_col1'].iat[1] == mean_num_col1 # 2.0 is exact
+    assert cleaned_df['num_col1'].iat[3] == mean_num_col1
+    assert cleaned_df['num_col2'].iat[0] == pytest.approx(mean_num_col2) # 9.9/3 is not
 
     # Check that non-NaN values and other columns are unchanged
-    assert cleaned_df.loc[0, 'num_col1'] == numeric_nulls_df.loc[0, 'num_col1']
-    assert cleaned_df['cat_col1'].equals(numeric_nulls_df['cat_col1'])
+    assert cleaned_df['num_col1'].iat[0] == numeric_nulls_df['num_col1'].iat[0]
+    assert np.array_equal(cleaned_df['cat_col1'].to_numpy(), numeric_nulls_df['cat_col1'].to_numpy())
 
 
-def test_replace_with_mean_mixed_nulls(mixed_nulls_df):
+def test_replace_with_mean_mixed_nulls(mixed_nulls_df, mixed_nulls_expected, mixed_nulls_null_counts):
     """Test replace_with_mean on a mixed-type DataFrame with various nulls."""
-    df_copy = mixed_nulls_df.copy()
-    cleaned_df = replace_with_mean(df_copy)
+    cleaned_df = replace_with_mean(mixed_nulls_df)
     assert cleaned_df.shape == mixed_nulls_df.shape
+    null_counts = cleaned_df.isna().sum()
 
     # Numeric columns that had NaNs should now be filled
-    assert cleaned_df['A_num'].isnull().sum() == 0
-    assert cleaned_df['C_num_with_nan'].isnull().sum() == 0
+    assert null_counts['A_num'] == 0
+    assert null_counts['C_num_with_nan'] == 0
     
     # E_all_nan_numeric will be all NaNs after mean(), as mean of all NaNs is NaN.
     # The function fillna(mean) will thus not change it.
-    assert cleaned_df['E_all_nan_numeric'].isnull().all()
-
+    assert null_counts['E_all_nan_numeric'] == len(cleaned_df)
 
     # Categorical columns should remain unchanged (still have their NaNs)
-    assert cleaned_df['B_cat'].isnull().sum() == mixed_nulls_df['B_cat'].isnull().sum()
-    assert cleaned_df['D_cat_with_nan'].isnull().sum() == mixed_nulls_df['D_cat_with_nan'].isnull().sum()
-    assert cleaned_df['F_all_nan_cat'].isnull().all() # This was all NaNs, should remain so
+    assert null_counts['B_cat'] == mixed_nulls_null_counts['B_cat']
+    assert null_counts['D_cat_with_nan'] == mixed_nulls_null_counts['D_cat_with_nan']
+    assert null_counts['F_all_nan_cat'] == len(cleaned_df) # This was all NaNs, should remain so
 
     # Verify specific mean replacements
-    mean_A_num = mixed_nulls_df['A_num'].mean() # (1+3+4+5)/4 = 13/4 = 3.25
-    assert cleaned_df.loc[1, 'A_num'] == pytest.approx(mean_A_num)
+    mean_A_num = mixed_nulls_expected["mean"]['A_num'] # (1+3+4+5)/4 = 13/4 = 3.25
+    tm.assert_series_equal(cleaned_df['A_num'],
+                           pd.Series([1.0, mean_A_num, 3.0, 4.0, 5.0], name='A_num'))
 
-    mean_C_num = mixed_nulls_df['C_num_with_nan'].mean() # (10+20+50)/3 = 80/3
-    assert cleaned_df.loc[2, 'C_num_with_nan'] == pytest.approx(mean_C_num)
-    assert cleaned_df.loc[3, 'C_num_with_nan'] == pytest.approx(mean_C_num)
+    mean_C_num = mixed_nulls_expected["mean"]['C_num_with_nan'] # (10+20+50)/3 = 80/3
+    tm.assert_series_equal(cleaned_df['C_num_with_nan'],
+                           pd.Series([10.0, 20.0, mean_C_num, mean_C_num, 50.0], name='C_num_with_nan'))
 
     # Non-numeric columns data should be preserved where not null
-    assert cleaned_df.loc[0, 'B_cat'] == mixed_nulls_df.loc[0, 'B_cat']
+    assert cleaned_df['B_cat'].iat[0] == mixed_nulls_df['B_cat'].iat[0]
 
 
 def test_replace_with_mean_all_null_numeric_column(all_null_column_df):
     """Test replace_with_mean where a numeric column is entirely null."""
     # Fixture: {'num_col_all_null': [nan, nan, nan], 'cat_col_all_null': [nan,nan,nan], 'mixed_col': [1, nan, 'a']}
-    df_copy = all_null_column_df.copy()
-    cleaned_df = replace_with_mean(df_copy)
+    cleaned_df = replace_with_mean(all_null_column_df)
 
     # The mean of an all-NaN column is NaN. So, fillna(NaN) doesn't change anything.
     assert cleaned_df['num_col_all_null'].isnull().all()
     # Categorical columns are not affected by replace_with_mean
     assert cleaned_df['cat_col_all_null'].isnull().all()
     # Mixed column - numeric parts are not touched if not NaN, NaNs in object col are not touched
-    assert cleaned_df.loc[0,'mixed_col'] == 1
-    assert pd.isna(cleaned_df.loc[1,'mixed_col']) # This was NaN, part of an object column, not touched
-    assert cleaned_df.loc[2,'mixed_col'] == 'a'
+    mixed_col = cleaned_df['mixed_col']
+    assert mixed_col.iat[0] == 1
+    assert pd.isna(mixed_col.iat[1]) # This was NaN, part of an object column, not touched
+    assert mixed_col.iat[2] == 'a'
 
     assert cleaned_df.shape == all_null_column_df.shape
 
-def test_replace_with_mean_empty_df(empty_df):
-    """Test replace_with_mean on an empty DataFrame."""
-    cleaned_df = replace_with_mean(empty_df.copy())
-    assert cleaned_df.empty
-    tm.assert_frame_equal(cleaned_df, empty_df)
-
-def test_replace_with_mean_no_nulls_df(no_nulls_df):
-    """Test replace_with_mean on a DataFrame with no nulls."""
-    df_copy = no_nulls_df.copy()
-    cleaned_df = replace_with_mean(df_copy)
-    tm.assert_frame_equal(cleaned_df, no_nulls_df)
-    assert cleaned_df.shape == no_nulls_df.shape
-
 # endregion Tests for replace_with_mean
 
 # region Tests for replace_with_median
-def test_replace_with_median_numeric_nulls(numeric_nulls_df):
+def test_replace_with_median_numeric_nulls(numeric_nulls_df, numeric_nulls_expected):
     """Test replace_with_median on a DataFrame with only numeric nulls."""
-    df_copy = numeric_nulls_df.copy()
-    cleaned_df = replace_with_median(df_copy)
+    cleaned_df = replace_with_median(numeric_nulls_df)
 
-    assert cleaned_df.isnull().sum().sum() == 0 # All nulls in numeric columns should be filled
+    assert not cleaned_df.isna().any(axis=None) # All nulls in numeric columns should be filled
     assert cleaned_df.shape == numeric_nulls_df.shape
 
     # Calculate expected medians
-    median_num_col1 = numeric_nulls_df['num_col1'].median() # [1.0, nan, 3.0, nan] -> median of [1.0, 3.0] is 2.0
-    median_num_col2 = numeric_nulls_df['num_col2'].median() # [nan, 2.2, 3.3, 4.4] -> median of [2.2, 3.3, 4.4] is 3.3
+    median_num_col1 = numeric_nulls_expected["median"]['num_col1'] # [1.0, nan, 3.0, nan] -> median of [1.0, 3.0] is 2.0
+    median_num_col2 = numeric_nulls_expected["median"]['num_col2'] # [nan, 2.2, 3.3, 4.4] -> median of [2.2, 3.3, 4.4] is 3.3
 
-    assert cleaned_df.loc[1, 'num_col1'] == pytest.approx(median_num_col1)
-    assert cleaned_df.loc[3, 'num_col1'] == pytest.approx(median_num_col1)
-    assert cleaned_df.loc[0, 'num_col2'] == pytest.approx(median_num_col2)
+    # Medians here are either a data value or the half-sum of two integers, so they are exact
+    assert cleaned_df['num_col1'].iat[1] == median_num_col1
+    assert cleaned_df['num_col1'].iat[3] == median_num_col1
+    assert cleaned_df['num_col2'].iat[0] == median_num_col2
 
-    assert cleaned_df.loc[0, 'num_col1'] == numeric_nulls_df.loc[0, 'num_col1']
-    assert cleaned_df['cat_col1'].equals(numeric_nulls_df['cat_col1'])
+    assert cleaned_df['num_col1'].iat[0] == numeric_nulls_df['num_col1'].iat[0]
+    assert np.array_equal(cleaned_df['cat_col1'].to_numpy(), numeric_nulls_df['cat_col1'].to_numpy())
 
-def test_replace_with_median_mixed_nulls(mixed_nulls_df):
+def test_replace_with_median_mixed_nulls(mixed_nulls_df, mixed_nulls_expected, mixed_nulls_null_counts):
     """Test replace_with_median on a mixed-type DataFrame."""
-    df_copy = mixed_nulls_df.copy()
-    cleaned_df = replace_with_median(df_copy)
+    cleaned_df = replace_with_median(mixed_nulls_df)
     assert cleaned_df.shape == mixed_nulls_df.shape
+    null_counts = cleaned_df.isna().sum()
 
-    assert cleaned_df['A_num'].isnull().sum() == 0
-    assert cleaned_df['C_num_with_nan'].isnull().sum() == 0
+    assert null_counts['A_num'] == 0
+    assert null_counts['C_num_with_nan'] == 0
     # E_all_nan_numeric will be all NaNs, as median of all NaNs is NaN.
-    assert cleaned_df['E_all_nan_numeric'].isnull().all()
+    assert null_counts['E_all_nan_numeric'] == len(cleaned_df)
 
-    assert cleaned_df['B_cat'].isnull().sum() == mixed_nulls_df['B_cat'].isnull().sum()
-    assert cleaned_df['D_cat_with_nan'].isnull().sum() == mixed_nulls_df['D_cat_with_nan'].isnull().sum()
-    assert cleaned_df['F_all_nan_cat'].isnull().all()
+    assert null_counts['B_cat'] == mixed_nulls_null_counts['B_cat']
+    assert null_counts['D_cat_with_nan'] == mixed_nulls_null_counts['D_cat_with_nan']
+    assert null_counts['F_all_nan_cat'] == len(cleaned_df)
 
-    median_A_num = mixed_nulls_df['A_num'].median() # [1.0, nan, 3.0, 4.0, 5.0] -> median of [1,3,4,5] is 3.5
-    assert cleaned_df.loc[1, 'A_num'] == pytest.approx(median_A_num)
+    median_A_num = mixed_nulls_expected["median"]['A_num'] # [1.0, nan, 3.0, 4.0, 5.0] -> median of [1,3,4,5] is 3.5
+    tm.assert_series_equal(cleaned_df['A_num'],
+                           pd.Series([1.0, median_A_num, 3.0, 4.0, 5.0], name='A_num'))
 
-    median_C_num = mixed_nulls_df['C_num_with_nan'].median() # [10.0, 20.0, nan, nan, 50.0] -> median of [10,20,50] is 20.0
-    assert cleaned_df.loc[2, 'C_num_with_nan'] == pytest.approx(median_C_num)
-    assert cleaned_df.loc[3, 'C_num_with_nan'] == pytest.approx(median_C_num)
+    median_C_num = mixed_nulls_expected["median"]['C_num_with_nan'] # [10.0, 20.0, nan, nan, 50.0] -> median of [10,20,50] is 20.0
+    tm.assert_series_equal(cleaned_df['C_num_with_nan'],
+                           pd.Series([10.0, 20.0, median_C_num, median_C_num, 50.0], name='C_num_with_nan'))
 
-    assert cleaned_df.loc[0, 'B_cat'] == mixed_nulls_df.loc[0, 'B_cat']
+    assert cleaned_df['B_cat'].iat[0] == mixed_nulls_df['B_cat'].iat[0]
 
 def test_replace_with_median_all_null_numeric_column(all_null_column_df):
     """Test replace_with_median where a numeric column is entirely null."""
-    df_copy = all_null_column_df.copy()
-    cleaned_df = replace_with_median(df_copy)
+    cleaned_df = replace_with_median(all_null_column_df)
 
     assert cleaned_df['num_col_all_null'].isnull().all() # Median is NaN, so no change
     assert cleaned_df['cat_col_all_null'].isnull().all() # Not affected
-    assert cleaned_df.loc[0,'mixed_col'] == 1
-    assert pd.isna(cleaned_df.loc[1,'mixed_col'])
-    assert cleaned_df.loc[2,'mixed_col'] == 'a'
+    mixed_col = cleaned_df['mixed_col']
+    assert mixed_col.iat[0] == 1
+    assert pd.isna(mixed_col.iat[1])
+    assert mixed_col.iat[2] == 'a'
     assert cleaned_df.shape == all_null_column_df.shape
 
-def test_replace_with_median_empty_df(empty_df):
-    """Test replace_with_median on an empty DataFrame."""
-    cleaned_df = replace_with_median(empty_df.copy())
-    assert cleaned_df.empty
-    tm.assert_frame_equal(cleaned_df, empty_df)
-
-def test_replace_with_median_no_nulls_df(no_nulls_df):
-    """Test replace_with_median on a DataFrame with no nulls."""
-    df_copy = no_nulls_df.copy()
-    cleaned_df = replace_with_median(df_copy)
-    tm.assert_frame_equal(cleaned_df, no_nulls_df)
-    assert cleaned_df.shape == no_nulls_df.shape
-
 # endregion Tests for replace_with_median
 
 # region Tests for replace_with_mode
-def test_replace_with_mode_numeric_nulls(numeric_nulls_df):
+def test_replace_with_mode_numeric_nulls(numeric_nulls_df, numeric_nulls_expected):
     """Test replace_with_mode on numeric nulls."""
     # num_col1: [1.0, np.nan, 3.0, np.nan], mode is 1.0 or 3.0 (pandas takes first) -> 1.0
     # num_col2: [np.nan, 2.2, 3.3, 4.4], modes are 2.2, 3.3, 4.4 (pandas takes first) -> 2.2
     # cat_col1: ['a', 'b', 'c', 'd'] (no nulls)
-    df_copy = numeric_nulls_df.copy()
-    cleaned_df = replace_with_mode(df_copy)
+    cleaned_df = replace_with_mode(numeric_nulls_df)
 
-    assert cleaned_df.isnull().sum().sum() == 0
+    assert not cleaned_df.isna().any(axis=None)
     assert cleaned_df.shape == numeric_nulls_df.shape
 
-    mode_num_col1 = numeric_nulls_df['num_col1'].mode().iloc[0] if not numeric_nulls_df['num_col1'].mode().empty else 0
-    mode_num_col2 = numeric_nulls_df['num_col2'].mode().iloc[0] if not numeric_nulls_df['num_col2'].mode().empty else 0
+    mode_num_col1 = numeric_nulls_expected["mode"].get('num_col1', 0)
+    mode_num_col2 = numeric_nulls_expected["mode"].get('num_col2', 0)
     
-    assert cleaned_df.loc[1, 'num_col1'] == pytest.approx(mode_num_col1)
-    assert cleaned_df.loc[3, 'num_col1'] == pytest.approx(mode_num_col1)
-    assert cleaned_df.loc[0, 'num_col2'] == pytest.approx(mode_num_col2)
-    assert cleaned_df['cat_col1'].equals(numeric_nulls_df['cat_col1'])
+    # A mode is copied from the data, so it compares exactly
+    assert cleaned_df['num_col1'].iat[1] == mode_num_col1
+    assert cleaned_df['num_col1'].iat[3] == mode_num_col1
+    assert cleaned_df['num_col2'].iat[0] == mode_num_col2
+    assert np.array_equal(cleaned_df['cat_col1'].to_numpy(), numeric_nulls_df['cat_col1'].to_numpy())
 
-def test_replace_with_mode_categorical_nulls(categorical_nulls_df):
+def test_replace_with_mode_categorical_nulls(categorical_nulls_df, categorical_nulls_expected):
     """Test replace_with_mode on categorical nulls."""
     # num_col1: [1.0, 2.0, 3.0, 4.0] (no nulls)
     # cat_col1: ['a', np.nan, 'c', np.nan], modes are 'a', 'c' -> 'a'
     # cat_col2: [np.nan, 'x', 'y', 'z'], modes are 'x','y','z' -> 'x'
-    df_copy = categorical_nulls_df.copy()
-    cleaned_df = replace_with_mode(df_copy)
+    cleaned_df = replace_with_mode(categorical_nulls_df)
 
-    assert cleaned_df.isnull().sum().sum() == 0
+    assert not cleaned_df.isna().any(axis=None)
     assert cleaned_df.shape == categorical_nulls_df.shape
 
-    mode_cat_col1 = categorical_nulls_df['cat_col1'].mode().iloc[0] if not categorical_nulls_df['cat_col1'].mode().empty else "Unknown"
-    mode_cat_col2 = categorical_nulls_df['cat_col2'].mode().iloc[0] if not categorical_nulls_df['cat_col2'].mode().empty else "Unknown"
+    mode_cat_col1 = categorical_nulls_expected["mode"].get('cat_col1', "Unknown")
+    mode_cat_col2 = categorical_nulls_expected["mode"].get('cat_col2', "Unknown")
 
-    assert cleaned_df.loc[1, 'cat_col1'] == mode_cat_col1
-    assert cleaned_df.loc[3, 'cat_col1'] == mode_cat_col1
-    assert cleaned_df.loc[0, 'cat_col2'] == mode_cat_col2
-    assert cleaned_df['num_col1'].equals(categorical_nulls_df['num_col1'])
+    assert cleaned_df['cat_col1'].iat[1] == mode_cat_col1
+    assert cleaned_df['cat_col1'].iat[3] == mode_cat_col1
+    assert cleaned_df['cat_col2'].iat[0] == mode_cat_col2
+    assert np.array_equal(cleaned_df['num_col1'].to_numpy(), categorical_nulls_df['num_col1'].to_numpy(), equal_nan=True)
 
 
-def test_replace_with_mode_mixed_nulls(mixed_nulls_df):
+def test_replace_with_mode_mixed_nulls(mixed_nulls_df, mixed_modes):
     """Test replace_with_mode on a mixed-type DataFrame."""
     # A_num: [1.0, np.nan, 3.0, 4.0, 5.0], mode is 1.0 (or 3,4,5) -> 1.0
     # B_cat: ['apple', 'banana', np.nan, 'cherry', 'banana'], mode is 'banana'
@@ -419,50 +422,52 @@ def test_replace_with_mode_mixed_nulls(mixed_nulls_df):
     # D_cat_with_nan: [None, 'dog', 'cat', None, 'dog'], mode is 'dog'
     # E_all_nan_numeric: [nan, nan, nan, nan, nan], mode is empty, fill with 0
     # F_all_nan_cat: [nan, nan, nan, nan, nan], mode is empty, fill with "Unknown"
-    df_copy = mixed_nulls_df.copy()
-    cleaned_df = replace_with_mode(df_copy)
+    cleaned_df = replace_with_mode(mixed_nulls_df)
 
-    assert cleaned_df.isnull().sum().sum() == 0 # All nulls should be handled
+    assert not cleaned_df.isna().any(axis=None) # All nulls should be handled
     assert cleaned_df.shape == mixed_nulls_df.shape
 
-    mode_A_num = mixed_nulls_df['A_num'].mode().iloc[0]
-    assert cleaned_df.loc[1, 'A_num'] == pytest.approx(mode_A_num)
+    mode_A_num = mixed_modes['A_num']
+    tm.assert_series_equal(cleaned_df['A_num'],
+                           pd.Series([1.0, mode_A_num, 3.0, 4.0, 5.0], name='A_num'))
 
-    mode_B_cat = mixed_nulls_df['B_cat'].mode().iloc[0]
-    assert cleaned_df.loc[2, 'B_cat'] == mode_B_cat
-    
-    mode_C_num = mixed_nulls_df['C_num_with_nan'].mode().iloc[0]
-    assert cleaned_df.loc[2, 'C_num_with_nan'] == pytest.approx(mode_C_num)
-    assert cleaned_df.loc[3, 'C_num_with_nan'] == pytest.approx(mode_C_num)
+    mode_B_cat = mixed_modes['B_cat']
+    tm.assert_series_equal(cleaned_df['B_cat'],
+                           pd.Series(['apple', 'banana', mode_B_cat, 'cherry', 'banana'], name='B_cat',
+                                     dtype=mixed_nulls_df['B_cat'].dtype))
+
+    mode_C_num = mixed_modes['C_num_with_nan']
+    tm.assert_series_equal(cleaned_df['C_num_with_nan'],
+                           pd.Series([10.0, 20.0, mode_C_num, mode_C_num, 50.0], name='C_num_with_nan'))
 
-    mode_D_cat = mixed_nulls_df['D_cat_with_nan'].mode().iloc[0]
-    assert cleaned_df.loc[0, 'D_cat_with_nan'] == mode_D_cat
-    assert cleaned_df.loc[3, 'D_cat_with_nan'] == mode_D_cat
+    mode_D_cat = mixed_modes['D_cat_with_nan']
+    tm.assert_series_equal(cleaned_df['D_cat_with_nan'],
+                           pd.Series([mode_D_cat, 'dog', 'cat', mode_D_cat, 'dog'], name='D_cat_with_nan',
+                                     dtype=mixed_nulls_df['D_cat_with_nan'].dtype))
     
     assert (cleaned_df['E_all_nan_numeric'] == 0).all() # Default for numeric when mode is empty
-    # F_all_nan_cat is float64 because it's all np.nan, so it will also be filled with 0 by current logic
-    assert (cleaned_df['F_all_nan_cat'] == 0).all()
+    # F_all_nan_cat is categorical with no observed values, so it takes the "Unknown" fallback
+    assert (cleaned_df['F_all_nan_cat'] == "Unknown").all()
 
 
-def test_replace_with_mode_all_null_columns(all_null_column_df):
+def test_replace_with_mode_all_null_columns(all_null_column_df, all_null_column_expected):
     """Test replace_with_mode for columns that are entirely null."""
     # num_col_all_null: [nan, nan, nan] -> fill with 0
     # cat_col_all_null: [nan, nan, nan] (this is float64) -> fill with 0
     # mixed_col: [1, np.nan, 'a'] -> mode is 1 (or 'a') -> 1
-    df_copy = all_null_column_df.copy()
-    cleaned_df = replace_with_mode(df_copy)
-    assert cleaned_df.isnull().sum().sum() == 0
+    cleaned_df = replace_with_mode(all_null_column_df)
+    assert not cleaned_df.isna().any(axis=None)
     assert cleaned_df.shape == all_null_column_df.shape
 
     assert (cleaned_df['num_col_all_null'] == 0).all()
     # cat_col_all_null is float64 because it's all np.nan, filled with 0 by current logic
     assert (cleaned_df['cat_col_all_null'] == 0).all()
     
-    mode_mixed_col = all_null_column_df['mixed_col'].mode().iloc[0] # Should be 1
-    assert cleaned_df.loc[1, 'mixed_col'] == mode_mixed_col
+    mode_mixed_col = all_null_column_expected["mode"]['mixed_col'] # Should be 1
+    assert cleaned_df['mixed_col'].iat[1] == mode_mixed_col
 
 
-def test_replace_with_mode_multiple_modes_takes_first(no_nulls_df):
+def test_replace_with_mode_multiple_modes_takes_first():
     """Test that replace_with_mode uses the first mode if multiple exist."""
     # Create a df with multiple modes specifically for this test
     data = {'multi_mode_col': [1, 1, 2, 2, 3, np.nan, np.nan]}
@@ -470,33 +475,27 @@ def test_replace_with_mode_multiple_modes_takes_first(no_nulls_df):
     # Pandas mode() for [1,1,2,2,3] returns a Series [1,2]. iloc[0] takes 1.
     expected_mode = df['multi_mode_col'].mode().iloc[0] # Should be 1
 
-    cleaned_df = replace_with_mode(df.copy())
-    assert cleaned_df.loc[5, 'multi_mode_col'] == expected_mode
-    assert cleaned_df.loc[6, 'multi_mode_col'] == expected_mode
-    assert cleaned_df.isnull().sum().sum() == 0
+    cleaned_df = replace_with_mode(df)
+    assert cleaned_df['multi_mode_col'].iat[5] == expected_mode
+    assert cleaned_df['multi_mode_col'].iat[6] == expected_mode
+    assert not cleaned_df.isna().any(axis=None)
 
 
-def test_replace_with_mode_empty_df(empty_df):
-    """Test replace_with_mode on an empty DataFrame."""
-    cleaned_df = replace_with_mode(empty_df.copy())
-    assert cleaned_df.empty
-    tm.assert_frame_equal(cleaned_df, empty_df)
-
-def test_replace_with_mode_no_nulls_df(no_nulls_df):
-    """Test replace_with_mode on a DataFrame with no nulls."""
-    df_copy = no_nulls_df.copy()
-    cleaned_df = replace_with_mode(df_copy)
-    tm.assert_frame_equal(cleaned_df, no_nulls_df)
-    assert cleaned_df.shape == no_nulls_df.shape
-
 def test_replace_with_mode_all_nan_object_column(all_nan_object_col_df):
     """Test replace_with_mode for an all-NaN object column (should use 'Unknown')."""
-    df_copy = all_nan_object_col_df.copy()
-    cleaned_df = replace_with_mode(df_copy)
+    cleaned_df = replace_with_mode(all_nan_object_col_df)
     assert (cleaned_df['obj_all_nan'] == "Unknown").all()
-    assert cleaned_df.isnull().sum().sum() == 0
+    assert not cleaned_df.isna().any(axis=None)
     assert cleaned_df.shape == all_nan_object_col_df.shape
 
+def test_replace_with_mode_all_nan_categorical_column():
+    """Test replace_with_mode for an all-NaN categorical column (adds 'Unknown' as a category)."""
+    df = pd.DataFrame({'cat_all_nan': pd.Categorical([np.nan, np.nan, np.nan], categories=['a'])})
+    cleaned_df = replace_with_mode(df)
+    assert isinstance(cleaned_df['cat_all_nan'].dtype, pd.CategoricalDtype)
+    assert (cleaned_df['cat_all_nan'] == "Unknown").all()
+    assert df['cat_all_nan'].isnull().all() # Input is left untouched
+
 # endregion Tests for replace_with_mode
 
 # region Tests for forward_fill
@@ -505,39 +504,37 @@ def test_forward_fill_numeric_nulls(numeric_nulls_df):
     # num_col1: [1.0, np.nan, 3.0, np.nan] -> ffill -> [1.0, 1.0, 3.0, 3.0]
     # num_col2: [np.nan, 2.2, 3.3, 4.4] -> ffill -> [np.nan, 2.2, 3.3, 4.4] (leading NaN remains)
     # cat_col1: ['a', 'b', 'c', 'd']
-    df_copy = numeric_nulls_df.copy()
-    cleaned_df = forward_fill(df_copy)
+    cleaned_df = forward_fill(numeric_nulls_df)
 
     assert cleaned_df.shape == numeric_nulls_df.shape
     # Check num_col1
-    expected_num_col1 = pd.Series([1.0, 1.0, 3.0, 3.0], name='num_col1')
-    tm.assert_series_equal(cleaned_df['num_col1'], expected_num_col1, check_dtype=False)
+    np.testing.assert_array_equal(cleaned_df['num_col1'].to_numpy(), np.array([1.0, 1.0, 3.0, 3.0]))
     # Check num_col2 (leading NaN)
-    assert pd.isna(cleaned_df.loc[0, 'num_col2'])
-    assert cleaned_df.loc[1, 'num_col2'] == 2.2
+    assert pd.isna(cleaned_df['num_col2'].iat[0])
+    assert cleaned_df['num_col2'].iat[1] == 2.2
     # Check cat_col1 (should be unchanged)
     tm.assert_series_equal(cleaned_df['cat_col1'], numeric_nulls_df['cat_col1'])
     # Overall null count
-    assert cleaned_df.isnull().sum().sum() == 1 # One leading NaN in num_col2
+    assert cleaned_df.isnull().to_numpy().sum() == 1 # One leading NaN in num_col2
 
 def test_forward_fill_categorical_nulls(categorical_nulls_df):
     """Test forward_fill on categorical nulls."""
     # cat_col1: ['a', np.nan, 'c', np.nan] -> ffill -> ['a', 'a', 'c', 'c']
     # cat_col2: [np.nan, 'x', 'y', 'z'] -> ffill -> [np.nan, 'x', 'y', 'z'] (leading NaN)
-    df_copy = categorical_nulls_df.copy()
-    cleaned_df = forward_fill(df_copy)
+    cleaned_df = forward_fill(categorical_nulls_df)
 
     assert cleaned_df.shape == categorical_nulls_df.shape
-    expected_cat_col1 = pd.Series(['a', 'a', 'c', 'c'], name='cat_col1')
-    tm.assert_series_equal(cleaned_df['cat_col1'], expected_cat_col1, check_dtype=False)
+    expected_cat_col1 = pd.Series(['a', 'a', 'c', 'c'], name='cat_col1',
+                                  dtype=categorical_nulls_df['cat_col1'].dtype)
+    tm.assert_series_equal(cleaned_df['cat_col1'], expected_cat_col1)
     
-    assert pd.isna(cleaned_df.loc[0, 'cat_col2'])
-    assert cleaned_df.loc[1, 'cat_col2'] == 'x'
+    assert pd.isna(cleaned_df['cat_col2'].iat[0])
+    assert cleaned_df['cat_col2'].iat[1] == 'x'
     tm.assert_series_equal(cleaned_df['num_col1'], categorical_nulls_df['num_col1'])
-    assert cleaned_df.isnull().sum().sum() == 1 # One leading NaN in cat_col2
+    assert cleaned_df.isnull().to_numpy().sum() == 1 # One leading NaN in cat_col2
 
 
-def test_forward_fill_mixed_leading_nulls(mixed_nulls_df):
+def test_forward_fill_mixed_leading_nulls(mixed_nulls_df, mixed_nulls_meta):
     """Test forward_fill with various nulls, including leading ones."""
     # A_num: [1.0, np.nan, 3.0, 4.0, 5.0] -> [1.0, 1.0, 3.0, 4.0, 5.0]
     # B_cat: ['apple', 'banana', np.nan, 'cherry', 'banana'] -> ['apple', 'banana', 'banana', 'cherry', 'banana']
@@ -545,53 +542,38 @@ def test_forward_fill_mixed_leading_nulls(mixed_nulls_df):
     # D_cat_with_nan: [None, 'dog', 'cat', None, 'dog'] -> [None, 'dog', 'cat', 'cat', 'dog'] (leading None remains)
     # E_all_nan_numeric: [nan, nan, nan, nan, nan] -> all nan
     # F_all_nan_cat: [nan, nan, nan, nan, nan] -> all nan
-    df_copy = mixed_nulls_df.copy()
-    cleaned_df = forward_fill(df_copy)
+    cleaned_df = forward_fill(mixed_nulls_df)
     assert cleaned_df.shape == mixed_nulls_df.shape
 
-    assert cleaned_df.loc[1, 'A_num'] == 1.0
-    assert cleaned_df.loc[2, 'B_cat'] == 'banana'
-    assert cleaned_df.loc[2, 'C_num_with_nan'] == 20.0
-    assert cleaned_df.loc[3, 'C_num_with_nan'] == 20.0
-    
-    assert pd.isna(cleaned_df.loc[0, 'D_cat_with_nan']) # Leading NaN
-    assert cleaned_df.loc[3, 'D_cat_with_nan'] == 'cat'
+    tm.assert_series_equal(cleaned_df['A_num'], _EXP_FFILL_A_NUM)
+    tm.assert_series_equal(cleaned_df['B_cat'],
+                           pd.Series(['apple', 'banana', 'banana', 'cherry', 'banana'], name='B_cat',
+                                     dtype=mixed_nulls_df['B_cat'].dtype))
+    tm.assert_series_equal(cleaned_df['C_num_with_nan'], _EXP_FFILL_C_NUM)
+    # Leading None has nothing to fill from
+    tm.assert_series_equal(cleaned_df['D_cat_with_nan'],
+                           pd.Series([None, 'dog', 'cat', 'cat', 'dog'], name='D_cat_with_nan',
+                                     dtype=mixed_nulls_df['D_cat_with_nan'].dtype))
     
     assert cleaned_df['E_all_nan_numeric'].isnull().all() # All NaNs remain
     assert cleaned_df['F_all_nan_cat'].isnull().all()     # All NaNs remain
 
     # Count total nulls remaining: 1 in D_cat_with_nan, 5 in E, 5 in F = 11
-    assert cleaned_df.isnull().sum().sum() == (1 + mixed_nulls_df['E_all_nan_numeric'].shape[0] + mixed_nulls_df['F_all_nan_cat'].shape[0])
+    assert cleaned_df.isnull().to_numpy().sum() == (1 + mixed_nulls_meta["E_all_nan_len"] + mixed_nulls_meta["F_all_nan_len"])
 
 
 def test_forward_fill_all_null_column(all_null_column_df):
     """Test forward_fill on a DataFrame with all-null columns."""
-    df_copy = all_null_column_df.copy()
-    cleaned_df = forward_fill(df_copy)
+    cleaned_df = forward_fill(all_null_column_df)
 
     # All-NaN columns should remain all-NaN
     assert cleaned_df['num_col_all_null'].isnull().all()
     assert cleaned_df['cat_col_all_null'].isnull().all() # This is float64, remains all NaN
 
     # mixed_col should be forward filled: [1, np.nan, 'a'] -> [1, 1, 'a']
-    expected_mixed_col = pd.Series([1, 1, 'a'], name='mixed_col', dtype=object)
-    tm.assert_series_equal(cleaned_df['mixed_col'], expected_mixed_col)
+    tm.assert_series_equal(cleaned_df['mixed_col'], _EXP_FFILL_MIXED_COL)
     assert cleaned_df.shape == all_null_column_df.shape
 
-
-def test_forward_fill_empty_df(empty_df):
-    """Test forward_fill on an empty DataFrame."""
-    cleaned_df = forward_fill(empty_df.copy())
-    assert cleaned_df.empty
-    tm.assert_frame_equal(cleaned_df, empty_df)
-
-def test_forward_fill_no_nulls_df(no_nulls_df):
-    """Test forward_fill on a DataFrame with no nulls."""
-    df_copy = no_nulls_df.copy()
-    cleaned_df = forward_fill(df_copy)
-    tm.assert_frame_equal(cleaned_df, no_nulls_df)
-    assert cleaned_df.shape == no_nulls_df.shape
-
 # endregion Tests for forward_fill
 
 # region Tests for backward_fill
@@ -600,39 +582,37 @@ def test_backward_fill_numeric_nulls(numeric_nulls_df):
     # num_col1: [1.0, np.nan, 3.0, np.nan] -> bfill -> [1.0, 3.0, 3.0, np.nan] (trailing NaN)
     # num_col2: [np.nan, 2.2, 3.3, 4.4] -> bfill -> [2.2, 2.2, 3.3, 4.4]
     # cat_col1: ['a', 'b', 'c', 'd']
-    df_copy = numeric_nulls_df.copy()
-    cleaned_df = backward_fill(df_copy)
+    cleaned_df = backward_fill(numeric_nulls_df)
 
     assert cleaned_df.shape == numeric_nulls_df.shape
     # Check num_col1 (trailing NaN)
-    assert cleaned_df.loc[1, 'num_col1'] == 3.0
-    assert pd.isna(cleaned_df.loc[3, 'num_col1'])
+    assert cleaned_df['num_col1'].iat[1] == 3.0
+    assert pd.isna(cleaned_df['num_col1'].iat[3])
     # Check num_col2
-    expected_num_col2 = pd.Series([2.2, 2.2, 3.3, 4.4], name='num_col2')
-    tm.assert_series_equal(cleaned_df['num_col2'], expected_num_col2, check_dtype=False)
+    np.testing.assert_array_equal(cleaned_df['num_col2'].to_numpy(), np.array([2.2, 2.2, 3.3, 4.4]))
     # Check cat_col1
     tm.assert_series_equal(cleaned_df['cat_col1'], numeric_nulls_df['cat_col1'])
-    assert cleaned_df.isnull().sum().sum() == 1 # One trailing NaN in num_col1
+    assert cleaned_df.isnull().to_numpy().sum() == 1 # One trailing NaN in num_col1
 
 def test_backward_fill_categorical_nulls(categorical_nulls_df):
     """Test backward_fill on categorical nulls."""
     # cat_col1: ['a', np.nan, 'c', np.nan] -> bfill -> ['a', 'c', 'c', np.nan] (trailing NaN)
     # cat_col2: [np.nan, 'x', 'y', 'z'] -> bfill -> ['x', 'x', 'y', 'z']
-    df_copy = categorical_nulls_df.copy()
-    cleaned_df = backward_fill(df_copy)
+    cleaned_df = backward_fill(categorical_nulls_df)
 
     assert cleaned_df.shape == categorical_nulls_df.shape
-    assert cleaned_df.loc[1, 'cat_col1'] == 'c'
-    assert pd.isna(cleaned_df.loc[3, 'cat_col1'])
+    assert cleaned_df['cat_col1'].iat[1] == 'c'
+    assert pd.isna(cleaned_df['cat_col1'].iat[3])
     
-    expected_cat_col2 = pd.Series(['x', 'x', 'y', 'z'], name='cat_col2', dtype=object)
-    tm.assert_series_equal(cleaned_df['cat_col2'], expected_cat_col2, check_dtype=False)
+    expected_cat_col2 = pd.Series(['x', 'x', 'y', 'z'], name='cat_col2',
+                                  dtype=categorical_nulls_df['cat_col2'].dtype)
+    tm.assert_series_equal(cleaned_df['cat_col2'], expected_cat_col2)
     
     tm.assert_series_equal(cleaned_df['num_col1'], categorical_nulls_df['num_col1'])
-    assert cleaned_df.isnull().sum().sum() == 1 # One trailing NaN in cat_col1
+    assert cleaned_df.isnull().to_numpy().sum() == 1 # One trailing NaN in cat_col1
 
 
-def test_backward_fill_mixed_trailing_nulls(mixed_nulls_df):
+def test_backward_fill_mixed_trailing_nulls(mixed_nulls_df, mixed_nulls_meta):
     """Test backward_fill with various nulls, including trailing ones."""
     # A_num: [1.0, np.nan, 3.0, 4.0, 5.0] -> [1.0, 3.0, 3.0, 4.0, 5.0]
     # B_cat: ['apple', 'banana', np.nan, 'cherry', 'banana'] -> ['apple', 'banana', 'cherry', 'cherry', 'banana']
@@ -640,16 +620,17 @@ def test_backward_fill_mixed_trailing_nulls(mixed_nulls_df):
     # D_cat_with_nan: [None, 'dog', 'cat', None, 'dog'] -> ['dog', 'dog', 'cat', 'dog', 'dog']
     # E_all_nan_numeric: [nan, nan, nan, nan, nan] -> all nan (trailing NaNs remain)
     # F_all_nan_cat: [nan, nan, nan, nan, nan] -> all nan (trailing NaNs remain)
-    df_copy = mixed_nulls_df.copy()
-    cleaned_df = backward_fill(df_copy)
+    cleaned_df = backward_fill(mixed_nulls_df)
     assert cleaned_df.shape == mixed_nulls_df.shape
 
-    assert cleaned_df.loc[1, 'A_num'] == 3.0
-    assert cleaned_df.loc[2, 'B_cat'] == 'cherry'
-    assert cleaned_df.loc[2, 'C_num_with_nan'] == 50.0
-    assert cleaned_df.loc[3, 'C_num_with_nan'] == 50.0
-    assert cleaned_df.loc[0, 'D_cat_with_nan'] == 'dog'
-    assert cleaned_df.loc[3, 'D_cat_with_nan'] == 'dog'
+    tm.assert_series_equal(cleaned_df['A_num'], _EXP_BFILL_A_NUM)
+    tm.assert_series_equal(cleaned_df['B_cat'],
+                           pd.Series(['apple', 'banana', 'cherry', 'cherry', 'banana'], name='B_cat',
+                                     dtype=mixed_nulls_df['B_cat'].dtype))
+    tm.assert_series_equal(cleaned_df['C_num_with_nan'], _EXP_BFILL_C_NUM)
+    tm.assert_series_equal(cleaned_df['D_cat_with_nan'],
+                           pd.Series(['dog', 'dog', 'cat', 'dog', 'dog'], name='D_cat_with_nan',
+                                     dtype=mixed_nulls_df['D_cat_with_nan'].dtype))
         
     assert cleaned_df['E_all_nan_numeric'].isnull().all()
     assert cleaned_df['F_all_nan_cat'].isnull().all()
@@ -657,46 +638,65 @@ def test_backward_fill_mixed_trailing_nulls(mixed_nulls_df):
     # Count total nulls remaining: 5 in E, 5 in F = 10
     # (Original mixed_nulls_df has 1+1+2+2+5+5 = 16 nulls)
     # After bfill, A_num (0), B_cat (0), C_num(0), D_cat(0), E(5), F(5) -> 10 nulls
-    assert cleaned_df.isnull().sum().sum() == (mixed_nulls_df['E_all_nan_numeric'].shape[0] + mixed_nulls_df['F_all_nan_cat'].shape[0])
+    assert cleaned_df.isnull().to_numpy().sum() == (mixed_nulls_meta["E_all_nan_len"] + mixed_nulls_meta["F_all_nan_len"])
 
 
 def test_backward_fill_all_null_column(all_null_column_df):
     """Test backward_fill on a DataFrame with all-null columns."""
-    df_copy = all_null_column_df.copy()
-    cleaned_df = backward_fill(df_copy)
+    cleaned_df = backward_fill(all_null_column_df)
 
     # All-NaN columns should remain all-NaN
     assert cleaned_df['num_col_all_null'].isnull().all()
     assert cleaned_df['cat_col_all_null'].isnull().all() # This is float64, remains all NaN
 
     # mixed_col should be backward filled: [1, np.nan, 'a'] -> [1, 'a', 'a']
-    expected_mixed_col = pd.Series([1, 'a', 'a'], name='mixed_col', dtype=object)
-    tm.assert_series_equal(cleaned_df['mixed_col'], expected_mixed_col)
+    tm.assert_series_equal(cleaned_df['mixed_col'], _EXP_BFILL_MIXED_COL)
     assert cleaned_df.shape == all_null_column_df.shape
 
-def test_backward_fill_empty_df(empty_df):
-    """Test backward_fill on an empty DataFrame."""
-    cleaned_df = backward_fill(empty_df.copy())
+# endregion Tests for backward_fill
+
+# region No-op tests shared by every strategy
+NULL_STRATEGIES = [
+    drop_nulls,
+    replace_with_fixed,
+    replace_with_mean,
+    replace_with_median,
+    replace_with_mode,
+    forward_fill,
+    backward_fill,
+]
+
+@pytest.mark.parametrize("fn", NULL_STRATEGIES, ids=lambda fn: fn.__name__)
+def test_noop_on_empty(fn, empty_df):
+    """Every strategy returns an empty DataFrame unchanged."""
+    cleaned_df = fn(empty_df)
     assert cleaned_df.empty
-    tm.assert_frame_equal(cleaned_df, empty_df)
+    assert cleaned_df.equals(empty_df)
 
-def test_backward_fill_no_nulls_df(no_nulls_df):
-    """Test backward_fill on a DataFrame with no nulls."""
-    df_copy = no_nulls_df.copy()
-    cleaned_df = backward_fill(df_copy)
-    tm.assert_frame_equal(cleaned_df, no_nulls_df)
-    assert cleaned_df.shape == no_nulls_df.shape
+@pytest.mark.parametrize("fn", NULL_STRATEGIES, ids=lambda fn: fn.__name__)
+def test_noop_on_no_nulls(fn, no_nulls_df):
+    """Every strategy returns a DataFrame without nulls unchanged."""
+    assert fn(no_nulls_df).equals(no_nulls_df)
 
-# endregion Tests for backward_fill
+@pytest.mark.parametrize("fn", NULL_STRATEGIES, ids=lambda fn: fn.__name__)
+@pytest.mark.parametrize("fixture_name", ["mixed_nulls_df", "all_null_column_df"])
+def test_does_not_mutate_input(fn, fixture_name, request):
+    """Every strategy returns a new frame, so tests can pass the shared fixtures straight in."""
+    df_in = request.getfixturevalue(fixture_name)
+    snapshot = df_in.copy()
+    fn(df_in)
+    tm.assert_frame_equal(df_in, snapshot)
+
+# endregion No-op tests shared by every strategy
 
 # region Tests for evaluate_methods
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_eval_dfs():
-    """Provides sample DataFrames for evaluate_methods tests."""
+    """Provides sample DataFrames for evaluate_methods tests; evaluate_methods only reads them, so they are built once."""
     original = pd.DataFrame({
         'A': [1, np.nan, 3, np.nan, 5],
-        'B': [np.nan, 'x', 'y', 'z', np.nan],
+        'B': pd.Categorical([np.nan, 'x', 'y', 'z', np.nan]),
         'C': [10, 20, 30, 40, 50] # No nulls
     }) # Total 4 nulls, shape (5,3)
 
@@ -717,7 +717,8 @@ def sample_eval_dfs():
     # Shape (5,3), 0 nulls, 4 nulls removed
 
     # Method3: Fills all with a fixed value (e.g., 0), keeps shape
-    method3_cleaned = original.fillna(0) # Shape (5,3), 0 nulls, 4 nulls removed
+    # B is categorical, so 0 has to be registered as a category before fillna can use it
+    method3_cleaned = original.assign(B=original['B'].cat.add_categories([0])).fillna(0) # Shape (5,3), 0 nulls, 4 nulls removed
     
     # Method4: Less effective, leaves some nulls, e.g. ffill
     method4_cleaned = original.ffill()
@@ -735,7 +736,7 @@ def sample_eval_dfs():
 def test_evaluate_methods_selects_best(sample_eval_dfs):
     """Test that evaluate_methods selects the method with the highest score."""
     original_df, cleaned_versions = sample_eval_dfs
-    log_lines = []
+    log_lines = deque()
     # mean_mode_fill and fixed_fill both have score 1.0. evaluate_methods will pick the one it encounters first.
     # In the fixture, mean_mode_fill is before fixed_fill if dict insertion order is preserved (Python 3.7+)
     # Let's ensure the test doesn't depend on this by slightly adjusting one score or testing for either.
@@ -755,7 +756,7 @@ def test_evaluate_methods_selects_best(sample_eval_dfs):
 def test_evaluate_methods_prefers_completeness_and_shape(sample_eval_dfs):
     """Test that score prioritizes null removal and then shape retention."""
     original_df, cleaned_versions = sample_eval_dfs
-    log_lines = []
+    log_lines = deque()
     # "mean_mode_fill" and "fixed_fill" are best (score 1.0)
     # "forward_fill" (score 0.875) is better than "drop_all_null_rows" (score 0.80)
     # because it preserves all rows even if it doesn't remove all nulls.
@@ -777,10 +778,10 @@ def test_evaluate_methods_prefers_completeness_and_shape(sample_eval_dfs):
 def test_evaluate_methods_no_nulls_original(no_nulls_df):
     """Test evaluate_methods when the original DataFrame has no nulls."""
     cleaned_versions = {
-        "method_A": no_nulls_df.copy(), # No change
-        "method_B": no_nulls_df.copy().assign(col_a = no_nulls_df['col_a'] * 2) # Changed data but no nulls
+        "method_A": no_nulls_df, # No change
+        "method_B": no_nulls_df.assign(col_a = no_nulls_df['col_a'] * 2) # Changed data but no nulls
     }
-    log_lines = []
+    log_lines = deque()
     # original_nulls = 0. Score = (1.0)*0.5 + row_ratio*0.25 + col_ratio*0.25
     # For method_A: 0.5 + 0.25 + 0.25 = 1.0
     # For method_B: 0.5 + 0.25 + 0.25 = 1.0
@@ -791,16 +792,16 @@ def test_evaluate_methods_no_nulls_original(no_nulls_df):
     # Check score calculation: nulls_removed / original_nulls becomes 1.0 if original_nulls is 0.
     # This is (1.0 * 0.5) + (1.0 * 0.25) + (1.0 * 0.25) = 1.0 for both.
     # The log should reflect scores of 1.0 for methods that preserve shape.
-    assert any(f"Strategy score: {1.0:.4f}" in line for line in log_lines)
+    assert "Strategy score: 1.0000" in log_lines[4] # method_A's score line (5 lines per method)
 
 
 def test_evaluate_methods_empty_original(empty_df):
     """Test evaluate_methods when the original DataFrame is empty."""
     cleaned_versions = {
-        "method_X": empty_df.copy(),
+        "method_X": empty_df,
         "method_Y": pd.DataFrame({'a':[1]}) # A method that creates data
     }
-    log_lines = []
+    log_lines = deque()
     # original_nulls = 0, original_shape = (0,0)
     # row_ratio and col_ratio will involve division by zero for original_shape.
     # The code has original_shape[0] if original_shape[0] else 0, so ratio is 0 if original dim is 0.
@@ -811,13 +812,13 @@ def test_evaluate_methods_empty_original(empty_df):
     # Both would have score 0.5. It will pick the first one.
     best_method = evaluate_methods(empty_df, cleaned_versions, log_lines)
     assert best_method == "method_X" 
-    assert any(f"Strategy score: {0.5:.4f}" in line for line in log_lines)
+    assert "Strategy score: 0.5000" in log_lines[4] # method_X's score line (5 lines per method)
 
 
 def test_evaluate_methods_log_content(sample_eval_dfs):
     """Test the content and structure of log lines from evaluate_methods."""
     original_df, cleaned_versions = sample_eval_dfs
-    log_lines = []
+    log_lines = deque()
     evaluate_methods(original_df, cleaned_versions, log_lines)
 
     assert len(log_lines) > 0
@@ -831,147 +832,137 @@ def test_evaluate_methods_log_content(sample_eval_dfs):
     assert "Method tried: forward_fill" in log_lines[15] 
     assert "✅ Best strategy selected: " in log_lines[-1]
 
+def test_evaluate_methods_does_not_mutate_inputs(sample_eval_dfs):
+    """sample_eval_dfs is module-scoped, which is only safe if evaluate_methods never writes to its inputs."""
+    original_df, cleaned_versions = sample_eval_dfs
+    original_snapshot = original_df.copy()
+    cleaned_snapshot = {name: df.copy() for name, df in cleaned_versions.items()}
+
+    evaluate_methods(original_df, cleaned_versions, deque())
+
+    assert original_df.equals(original_snapshot)
+    assert cleaned_versions.keys() == cleaned_snapshot.keys()
+    assert all(cleaned_versions[name].equals(df) for name, df in cleaned_snapshot.items())
+
 # endregion Tests for evaluate_methods
 
 # region Integration Tests for process_csv
-
-def test_process_csv_integration_basic(mixed_nulls_df):
+# These tests write only under tmp_path, which is per-test (and per xdist worker), so they
+# need no xdist_group. process_csv also logs through the process-global `logging` module;
+# assert on the null_handling_log.txt it writes, never on global logger state.
+
+# process_csv only reads its input, so the input CSV is written once per module and shared
+# by the integration tests below.
+@pytest.fixture(scope="module")
+def mixed_nulls_csv_path(tmp_path_factory, mixed_nulls_df):
+    path = tmp_path_factory.mktemp("data") / "input.csv"
+    mixed_nulls_df.to_csv(path, index=False)
+    return path
+
+def test_process_csv_integration_basic(tmp_path, mixed_nulls_csv_path, mixed_nulls_total_nulls):
     """Basic integration test for process_csv with a DataFrame having nulls."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        input_csv_path = os.path.join(tmpdir, "input.csv")
-        output_csv_path = os.path.join(tmpdir, "output.csv")
-        log_file_path = os.path.join(tmpdir, "null_handling_log.txt")
-
-        # Save the mixed_nulls_df to a temporary CSV file
-        mixed_nulls_df.to_csv(input_csv_path, index=False)
-
-        process_csv(input_csv_path, output_csv_path)
-
-        assert os.path.exists(output_csv_path)
-        assert os.path.exists(log_file_path)
-
-        processed_df = pd.read_csv(output_csv_path)
-        # The best method for mixed_nulls_df according to evaluate_methods
-        # (using the sample_eval_dfs logic as a guide) would likely be one that fills all nulls
-        # and preserves shape, e.g., mean/mode fill or fixed fill.
-        # We expect no nulls in the output if a fill strategy is chosen.
-        # If drop_nulls was chosen, it would be empty.
-        # The key is that *some* processing happened and an output was generated.
-        # A more robust check would be to replicate the logic of evaluate_methods here,
-        # but for an integration test, checking for non-null output (or specific known output) is good.
-        
-        # Let's verify the output isn't empty and has fewer or equal nulls than input
-        assert not processed_df.empty
-        assert processed_df.isnull().sum().sum() < mixed_nulls_df.isnull().sum().sum() or \
-               (mixed_nulls_df.isnull().sum().sum() == 0 and processed_df.isnull().sum().sum() == 0)
-
-
-        with open(log_file_path, "r") as f:
-            log_content = f.read()
-        assert "Processing file: " + input_csv_path in log_content
-        assert "Initial shape: " in log_content
-        assert "Total null values: " in log_content
-        assert "Best strategy selected: " in log_content
-        # The following are standard log messages, not in the specific log file
-        assert "Cleaned CSV saved at: " not in log_content
-        assert "Decision-making log saved at: " not in log_content
-
-def test_process_csv_no_nulls_input(no_nulls_df):
+    input_csv_path = mixed_nulls_csv_path
+    output_csv_path = tmp_path / "output.csv"
+    log_file_path = tmp_path / "null_handling_log.txt"
+
+    process_csv(input_csv_path, output_csv_path)
+
+    assert output_csv_path.exists()
+    assert log_file_path.exists()
+
+    processed_df = pd.read_csv(output_csv_path)
+    # The best method for mixed_nulls_df according to evaluate_methods
+    # (using the sample_eval_dfs logic as a guide) would likely be one that fills all nulls
+    # and preserves shape, e.g., mean/mode fill or fixed fill.
+    # We expect no nulls in the output if a fill strategy is chosen.
+    # If drop_nulls was chosen, it would be empty.
+    # The key is that *some* processing happened and an output was generated.
+    # A more robust check would be to replicate the logic of evaluate_methods here,
+    # but for an integration test, checking for non-null output (or specific known output) is good.
+    
+    # Let's verify the output isn't empty and has fewer or equal nulls than input
+    assert not processed_df.empty
+    processed_nulls = processed_df.isnull().to_numpy().sum()
+    original_nulls = mixed_nulls_total_nulls
+    assert processed_nulls < original_nulls or (original_nulls == 0 and processed_nulls == 0)
+
+
+    log_content = log_file_path.read_text()
+    assert f"Processing file: {input_csv_path}" in log_content
+    assert "Initial shape: " in log_content
+    assert "Total null values: " in log_content
+    assert "Best strategy selected: " in log_content
+    # The following are standard log messages, not in the specific log file
+    assert "Cleaned CSV saved at: " not in log_content
+    assert "Decision-making log saved at: " not in log_content
+
+def test_process_csv_no_nulls_input(tmp_path, no_nulls_df):
     """Test process_csv with an input CSV that has no null values."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        input_csv_path = os.path.join(tmpdir, "input_no_nulls.csv")
-        output_csv_path = os.path.join(tmpdir, "output_no_nulls.csv")
-        
-        no_nulls_df.to_csv(input_csv_path, index=False)
-        process_csv(input_csv_path, output_csv_path)
-
-        assert os.path.exists(output_csv_path)
-        processed_df = pd.read_csv(output_csv_path)
-        tm.assert_frame_equal(processed_df, no_nulls_df) # Output should be identical to input
-
-        log_file_path = os.path.join(tmpdir, "null_handling_log.txt")
-        assert os.path.exists(log_file_path)
-        with open(log_file_path, "r") as f:
-            log_content = f.read()
-        assert "Total null values: 0" in log_content
-        # Best strategy might still be identified, e.g., one that preserves shape perfectly.
-
-def test_process_csv_empty_input_csv(empty_df):
-    """Test process_csv with an empty input CSV file."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        input_csv_path = os.path.join(tmpdir, "empty_input.csv")
-        output_csv_path = os.path.join(tmpdir, "empty_output.csv")
-        log_file_path = os.path.join(tmpdir, "null_handling_log.txt")
-
-        empty_df.to_csv(input_csv_path, index=False) # Creates an empty file with headers if df has columns
-        
-        # If empty_df fixture is truly empty (no columns), to_csv creates an empty file.
-        # If it has columns but no rows, it creates a file with only headers.
-        # Let's ensure it's a truly empty file for one variant of this test.
-        with open(input_csv_path, 'w') as f:
-            f.write("") # Create a truly empty file
-
-        process_csv(input_csv_path, output_csv_path)
-
-        # For a truly empty CSV, pandas read_csv might raise EmptyDataError or return empty DF
-        # The `process_csv` function logs "Input CSV is empty. No processing done." and returns.
-        # So, no output CSV or log file should be created by `process_csv` itself in this case.
-        # However, the logging in process_csv is to python's logging, not the log file it creates.
-        # The log file is only created if processing proceeds.
-        assert not os.path.exists(output_csv_path) # No output CSV should be created
-        assert not os.path.exists(log_file_path) # No custom log file from the function
-
-def test_process_csv_empty_input_with_headers(empty_df):
-    """Test process_csv with an input CSV that has headers but no data."""
-    df_with_cols_no_rows = pd.DataFrame(columns=['col1', 'col2'])
-    with tempfile.TemporaryDirectory() as tmpdir:
-        input_csv_path = os.path.join(tmpdir, "empty_data.csv")
-        output_csv_path = os.path.join(tmpdir, "empty_data_output.csv")
-        log_file_path = os.path.join(tmpdir, "null_handling_log.txt")
-
-        df_with_cols_no_rows.to_csv(input_csv_path, index=False)
-        process_csv(input_csv_path, output_csv_path)
-        
-        # df.empty is true. Function should log "Input CSV is empty." and return.
-        assert not os.path.exists(output_csv_path)
-        assert not os.path.exists(log_file_path)
-
-
-def test_process_csv_non_existent_input():
-    """Test process_csv with a non-existent input CSV file."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        input_csv_path = os.path.join(tmpdir, "non_existent_input.csv")
-        output_csv_path = os.path.join(tmpdir, "output.csv")
-        log_file_path = os.path.join(tmpdir, "null_handling_log.txt")
-
-        process_csv(input_csv_path, output_csv_path)
-
-        # Function should log "Input file not found" and return.
-        assert not os.path.exists(output_csv_path)
-        assert not os.path.exists(log_file_path) # Log file is only created on successful processing path
-
-def test_process_csv_output_directory_creation():
+    input_csv_path = tmp_path / "input_no_nulls.csv"
+    no_nulls_df.to_csv(input_csv_path, index=False)
+    output_csv_path = tmp_path / "output_no_nulls.csv"
+    log_file_path = tmp_path / "null_handling_log.txt"
+
+    process_csv(input_csv_path, output_csv_path)
+
+    assert output_csv_path.exists()
+    processed_df = pd.read_csv(output_csv_path)
+    # Output should be identical to input; CSV does not round-trip the category dtype
+    assert processed_df.equals(no_nulls_df.astype({'col_b': object}))
+    assert log_file_path.exists()
+    assert "Total null values: 0" in log_file_path.read_text()
+
+def test_process_df_no_nulls_input(no_nulls_df):
+    """Test the in-memory process_df entry point with a DataFrame that has no null values."""
+    log_lines = deque()
+    best_df = process_df(no_nulls_df, log_lines)
+
+    # Output should be identical to input, dtypes included (no CSV round-trip)
+    assert best_df.equals(no_nulls_df)
+    assert log_lines[0] == f"Initial shape: {no_nulls_df.shape}"
+    assert "Total null values: 0" in log_lines[1]
+    assert "Best strategy selected: " in log_lines[-1]
+
+@pytest.mark.parametrize("setup", ["nonexistent", "empty_file", "empty_headers"])
+def test_process_csv_short_circuits(tmp_path, setup):
+    """Test that process_csv returns early, writing nothing, for missing or empty input."""
+    input_csv_path = tmp_path / "input.csv"
+    output_csv_path = tmp_path / "output.csv"
+    log_file_path = tmp_path / "null_handling_log.txt"
+
+    if setup == "empty_file":
+        # read_csv raises EmptyDataError, which process_csv logs and returns on
+        input_csv_path.write_text("")
+    elif setup == "empty_headers":
+        # Headers but no rows: df.empty is true, so process_csv logs "Input CSV is empty." and returns
+        pd.DataFrame(columns=['col1', 'col2']).to_csv(input_csv_path, index=False)
+    # "nonexistent": no file at all, process_csv logs "Input file not found" and returns
+
+    process_csv(input_csv_path, output_csv_path)
+
+    # The log file is only created if processing proceeds; early exits only use python's logging
+    assert not output_csv_path.exists()
+    assert not log_file_path.exists()
+
+def test_process_csv_output_directory_creation(tmp_path, mixed_nulls_csv_path, mixed_nulls_total_nulls):
     """Test that process_csv creates the output directory if it doesn't exist."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create a dummy input CSV
-        input_csv_path = os.path.join(tmpdir, "input.csv")
-        dummy_df = pd.DataFrame({'a':[1,2,np.nan]})
-        dummy_df.to_csv(input_csv_path, index=False)
+    input_csv_path = mixed_nulls_csv_path
 
-        # Define an output path in a subdirectory that doesn't exist yet
-        output_subdir = os.path.join(tmpdir, "new_output_dir")
-        output_csv_path = os.path.join(output_subdir, "output.csv")
-        log_file_path = os.path.join(output_subdir, "null_handling_log.txt") # log also goes here
+    # Define an output path in a subdirectory that doesn't exist yet
+    output_subdir = tmp_path / "new_output_dir"
+    output_csv_path = output_subdir / "output.csv"
+    log_file_path = output_subdir / "null_handling_log.txt" # log also goes here
 
-        assert not os.path.exists(output_subdir) # Ensure subdir does not exist
+    assert not output_subdir.exists() # Ensure subdir does not exist
 
-        process_csv(input_csv_path, output_csv_path)
+    process_csv(input_csv_path, output_csv_path)
 
-        assert os.path.exists(output_subdir) # Subdir should be created
-        assert os.path.exists(output_csv_path) # Output CSV should exist in subdir
-        assert os.path.exists(log_file_path) # Log file should also exist in subdir
-        
-        processed_df = pd.read_csv(output_csv_path)
-        assert processed_df['a'].isnull().sum() == 0 # e.g. filled with mean or mode or fixed
+    assert output_subdir.exists() # Subdir should be created
+    assert output_csv_path.exists() # Output CSV should exist in subdir
+    assert log_file_path.exists() # Log file should also exist in subdir
+    
+    processed_df = pd.read_csv(output_csv_path)
+    assert not processed_df.empty
+    assert processed_df.isnull().to_numpy().sum() < mixed_nulls_total_nulls # some nulls were handled
 
 # endregion Integration Tests for process_csv
@@ -1,11 +1,13 @@
 from flask import Flask, request, jsonify, Response
 import pandas as pd
 from flask_cors import CORS
-import chardet
+from charset_normalizer import from_bytes
+import orjson
 import re
 from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager, create_access_token, jwt_required, get_jwt_identity
 from pymongo import MongoClient
+from bson import Binary
 from dotenv import load_dotenv
 from datetime import timedelta
 import uuid
@@ -56,6 +58,26 @@ def is_strong_password(password):
         return False
     return True
 
+def detect_encoding(file, sample_size=65536):
+    """Guess the encoding of an uploaded file from its first sample_size bytes (all of it for -1) and rewind it."""
+    sample = file.stream.read(sample_size)
+    file.seek(0)
+    if sample.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8-sig'
+    if sample.isascii():
+        return 'utf-8'
+    best = from_bytes(sample).best()
+    return best.encoding if best else 'utf-8'
+
+def read_with_encoding_fallback(file, encoding, read):
+    """Call read(encoding); if the file does not decode with the sample-based guess, retry with one made from the whole file."""
+    try:
+        return read(encoding)
+    except UnicodeDecodeError:
+        file.seek(0)
+        fallback = detect_encoding(file, sample_size=-1)
+        return read(fallback)
+
 # Validate contact us from input
 def validate_contact_form(data):
     errors = []
@@ -131,8 +153,11 @@ def signup():
     
     hashed_password = bcrypt.generate_password_hash(password).decode('utf-8')
     
+    user_uuid = uuid.uuid4()
+    # Key the document on the UUID itself so lookups hit the built-in _id index
     new_user = {
-        'user_id': str(uuid.uuid4()),
+        '_id': Binary.from_uuid(user_uuid),
+        'user_id': str(user_uuid),
         'email': email,
         'password': hashed_password,
         'created_at': pd.Timestamp.now().isoformat()
@@ -186,11 +211,17 @@ def get_user_profile():
     """Get the current user's profile"""
     current_user_id = get_jwt_identity()
     
-    user = users_collection.find_one({'user_id': current_user_id}, {'password': 0})  # Exclude password
+    try:
+        user_key = Binary.from_uuid(uuid.UUID(current_user_id))
+    except ValueError:
+        return jsonify({'status': 'error', 'message': 'User not found'}), 404
+
+    # Older accounts are re-keyed once by services/migrate_user_ids.py
+    user = users_collection.find_one({'_id': user_key}, {'password': 0})  # Exclude password
     if not user:
         return jsonify({'status': 'error', 'message': 'User not found'}), 404
     
-    user['_id'] = str(user['_id'])
+    user['_id'] = current_user_id
     
     return jsonify({
         'status': 'success',
@@ -210,14 +241,11 @@ def upload_file_csv():
     filename = file.filename
     if not filename.lower().endswith(".csv"):
         return jsonify({'status':"error",'error': "Only CSV files can be uploaded"}), 400
-    raw_data = file.read()
-    result = chardet.detect(raw_data)
-    encoding = result.get('encoding')#result['encoding']
-
-    file.seek(0)
+    encoding = detect_encoding(file)
 
     try:
-        stats = summarize_csv(file, encoding=encoding, export_json=False)
+        stats = read_with_encoding_fallback(
+            file, encoding, lambda enc: summarize_csv(file, encoding=enc, export_json=False))
         
         return jsonify({
             "status": "success",
@@ -235,17 +263,24 @@ def upload_file():
     filename = file.filename
     if not filename.lower().endswith(".csv"):
         return jsonify({'status':"error",'error': "Only CSV files can be uploaded"}), 400
-    raw_data = file.read()
-    result = chardet.detect(raw_data)
-    encoding = result['encoding']
+    encoding = detect_encoding(file)
     save_path = f"./uploaded_files/{filename}"
     file.seek(0)
     file.save(save_path)
     file.seek(0)
 
     try:
-        df = pd.read_csv(file, encoding=encoding)
-        return jsonify({ "status": "success", "filename": filename,'message': 'File processed successfully!', "preview": df.head(5).to_dict(), "columns": df.columns.tolist(),"shape": df.shape}), 200
+        df = read_with_encoding_fallback(file, encoding, lambda enc: pd.read_csv(file, encoding=enc))
+        # Column-oriented preview serialized by orjson, which handles numpy scalars natively
+        payload = {
+            "status": "success",
+            "filename": filename,
+            'message': 'File processed successfully!',
+            "preview": df.head(5).to_dict(orient='list'),
+            "columns": df.columns.tolist(),
+            "shape": list(df.shape)
+        }
+        return Response(orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY), status=200, mimetype='application/json')
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -0,0 +1,39 @@
+import os
+import uuid
+from bson import Binary
+from dotenv import load_dotenv
+from pymongo import MongoClient
+
+# One-off migration: re-key user documents created before signup stored the
+# UUID as a binary _id, so /me only ever needs a single _id lookup.
+# Run once from the backend directory, before deploying the /me that relies on it:
+#     python services/migrate_user_ids.py
+# It is safe to re-run, e.g. after it was interrupted.
+
+def main():
+    load_dotenv()
+    mongo_client = MongoClient(os.getenv("MONGODB_URI"))
+    users_collection = mongo_client["auto-eda-backend"].users
+
+    migrated = 0
+    skipped = 0
+    for user in users_collection.find({'_id': {'$not': {'$type': 'binData'}}}):
+        old_id = user['_id']
+        try:
+            new_id = Binary.from_uuid(uuid.UUID(user['user_id']))
+        except (KeyError, TypeError, ValueError):
+            print(f"Skipping user document {old_id}: no valid user_id.")
+            skipped += 1
+            continue
+
+        # _id cannot be updated in place. Upserting keeps a re-run from failing on a
+        # copy left by an interrupted run; the old document is removed only after that.
+        user['_id'] = new_id
+        users_collection.replace_one({'_id': new_id}, user, upsert=True)
+        users_collection.delete_one({'_id': old_id})
+        migrated += 1
+
+    print(f"Migrated {migrated} user document(s) to a binary UUID _id, skipped {skipped}.")
+
+if __name__ == '__main__':
+    main()
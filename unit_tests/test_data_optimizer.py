@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 import sys
@@ -14,32 +15,37 @@ from autoeda.data_optimizer import optimize_dtypes
 from autoeda.data_optimizer import optimize_csv
 
 
-def test_categorical_conversion():
+@pytest.fixture(scope="module")
+def categorical_df():
+    # Built once per module; optimize_dtypes works on a copy so sharing is safe
+    small = np.array([f'item_{i % 49}' for i in range(100)], dtype=object)
+    large = np.array([f'item_{i % 52}' for i in range(100)], dtype=object)
+    return pd.DataFrame({
+        "small_category": small,
+        "large_category": large,
+        'numeric': np.arange(100, dtype=np.int64)
+    })
+
 
-    df = pd.DataFrame({
-        "small_category": [f'item_{i % 49}' for i in range(100)],  
-        "large_category": [f'item_{i % 52}' for i in range(100)],  
-        'numeric': list(range(100))  
+@pytest.fixture(scope="module")
+def numerical_df():
+    return pd.DataFrame({
+        'float_col': np.array([4.7, 8.8, 3, 72.89213, 9823.09329], dtype=np.float64),
+        'int_col': np.array([3, 45, 32, 2233, 739281802301], dtype=np.int64),
+        'created_date': np.array(['2023-01-01', '2023-01-02', '2023-01-03', '2023-01-04', '2023-01-05'], dtype=object),
+        'bad_timestamp': np.array(['not-a-date', '2023-02-30', '13-2023-01', 'someday', ''], dtype=object)
     })
-    optimized_df = optimize_dtypes(df)
+
+
+def test_categorical_conversion(categorical_df):
+    optimized_df = optimize_dtypes(categorical_df)
     assert optimized_df['small_category'].dtype.name == 'category', "small_category should be converted to category"
     assert optimized_df['large_category'].dtype.name != 'category', "large_category should not be converted"
     assert optimized_df['numeric'].dtype.kind in ['i', 'f'], "numeric column should remain numeric"
 
 
-def test_numerical_conversion():
-    int_data=[3,45,32,2233,739281802301]
-    float_data=[4.7,8.8,3,72.89213,9823.09329]
-    date_data = ['2023-01-01', '2023-01-02', '2023-01-03', '2023-01-04', '2023-01-05']
-    bad_date_data= ['not-a-date', '2023-02-30', '13-2023-01', 'someday', '']
-    df=pd.DataFrame({
-         'float_col': float_data,
-        'int_col': int_data,
-        'created_date': date_data,
-        'bad_timestamp': bad_date_data
-    })
-
-    df_optimized=optimize_dtypes(df)
+def test_numerical_conversion(numerical_df):
+    df_optimized=optimize_dtypes(numerical_df)
     assert df_optimized['float_col'].dtype.name in ['float32', 'float16']
     assert df_optimized['int_col'].dtype.name in ['int32','int16']
     assert is_datetime64_any_dtype(df_optimized['created_date']), "created_date should be datetime"
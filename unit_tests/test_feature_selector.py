@@ -2,19 +2,20 @@ import unittest
 import pandas as pd
 import numpy as np
 import os
-import shutil  # For directory cleanup
+import tempfile
+from unittest.mock import patch
 from pandas.testing import assert_frame_equal, assert_series_equal
 
 # Adjust path to import from autoeda (assuming unit_tests is at the same level as autoeda)
 import sys
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from autoeda import feature_selector
 from autoeda.feature_selector import (
     remove_low_variance,
     remove_highly_correlated,
     select_by_model_importance,
     run_feature_selection,
-    log_file_path as main_log_file_path # Get the log file path from the module
 )
 
 class TestFeatureSelector(unittest.TestCase):
@@ -22,39 +23,18 @@ class TestFeatureSelector(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Set up for all tests in the class."""
-        cls.test_output_dir = "output_unit_tests"
-        if os.path.exists(cls.test_output_dir):
-            shutil.rmtree(cls.test_output_dir) # Clean up from previous runs
-        os.makedirs(cls.test_output_dir, exist_ok=True)
+        # Process-private output directory, removed again in tearDownClass
+        cls._tmpdir_ctx = tempfile.TemporaryDirectory(prefix="autoeda_test_")
+        cls.test_output_dir = cls._tmpdir_ctx.name
         
-        # Override the log file path for tests to avoid polluting the main log
-        # This requires the feature_selector module to be reloadable or its global var to be patchable.
-        # For simplicity, we'll let it write to the default log path but manage it in tearDown.
-        # A better way would be to pass logger instance or log_path to functions.
-        cls.original_log_file_path = main_log_file_path
-        cls.test_log_file = os.path.join(cls.test_output_dir, "test_feature_selection_log.txt")
+        # A small forest is enough to tell zero-importance features apart
+        cls.n_estimators = 10
 
-        # Ensure the main log's directory exists as the module tries to create it
-        if not os.path.exists(os.path.dirname(main_log_file_path)):
-             os.makedirs(os.path.dirname(main_log_file_path), exist_ok=True)
-
-
-    def setUp(self):
-        """Set up for each test method."""
-        # Clear the test log file before each test
-        if os.path.exists(self.test_log_file):
-            os.remove(self.test_log_file)
+        # Sample DataFrames are built once and shared; the functions under test do not mutate their inputs
+        cls.df_empty = pd.DataFrame()
+        cls.df_no_numeric = pd.DataFrame({'A': ['x', 'y', 'z'], 'B': ['p', 'q', 'r']})
         
-        # For run_feature_selection, it writes to the global log_file_path.
-        # We will check this global log file. Clear it before tests that use it.
-        if os.path.exists(self.original_log_file_path):
-            os.remove(self.original_log_file_path)
-
-        # Sample DataFrames
-        self.df_empty = pd.DataFrame()
-        self.df_no_numeric = pd.DataFrame({'A': ['x', 'y', 'z'], 'B': ['p', 'q', 'r']})
-        
-        self.df_low_var_mixed = pd.DataFrame({
+        cls.df_low_var_mixed = pd.DataFrame({
             'A': [1, 2, 3, 4, 5],    # Var = 2.5
             'B': [1, 1, 1, 1, 1],    # Var = 0
             'C': [0.1, 0.2, 0.1, 0.2, 0.1], # Var = 0.007
@@ -62,7 +42,7 @@ class TestFeatureSelector(unittest.TestCase):
             'E': ['cat', 'dog', 'cat', 'dog', 'cat'] # Non-numeric
         })
 
-        self.df_corr_mixed = pd.DataFrame({
+        cls.df_corr_mixed = pd.DataFrame({
             'F1': [1, 2, 3, 4, 5],      # Reference
             'F2': [1.1, 2.1, 3.1, 4.1, 5.1], # Correlated with F1 (drops F2)
             'F3': [-1, -2, -3, -4, -5], # Correlated with F1 (drops F3)
@@ -84,83 +64,78 @@ class TestFeatureSelector(unittest.TestCase):
         # (F3,F4)
         # If corr(F0,F1) is high: index='F0', column='F1'. 'F0' > 'F1' is False. 'F1' is dropped. (Keeps F0)
 
-        self.df_model = pd.DataFrame({
-            'M_Feat1': np.array([1.0, 2.0, 3.0, 4.0, 5.0, np.nan, 7.0, 8.0, 9.0, 10.0] * 10), # 100 rows
-            'M_Feat2_imp': np.array([1.1, 2.1, 3.1, 4.1, 5.1, 6.1, 7.1, 8.1, 9.1, 10.1] * 10),
-            'M_Feat3_zero_imp': [0.01] * 100, # Constant feature, should have zero importance after imputation
-            'M_Feat4_text': ['P', 'Q'] * 50,
+        # Vectorized 100-row columns; pandas adopts the ndarrays without a list round-trip
+        cls._m_feat1 = np.tile([1.0, 2.0, 3.0, 4.0, 5.0, np.nan, 7.0, 8.0, 9.0, 10.0], 10)
+        cls._m_feat2 = np.tile(np.arange(1.0, 11.0) + 0.1, 10) # 1.1, 2.1, ..., 10.1
+        cls.df_model = pd.DataFrame({
+            'M_Feat1': cls._m_feat1,
+            'M_Feat2_imp': cls._m_feat2,
+            'M_Feat3_zero_imp': np.full(100, 0.01), # Constant feature, should have zero importance after imputation
+            'M_Feat4_text': np.tile(np.array(['P', 'Q'], dtype=object), 50),
         })
-        self.target_reg = pd.Series(self.df_model['M_Feat2_imp'] * 2 + np.random.normal(0, 0.1, 100), name="TargetR")
-        self.target_clf = pd.Series( (self.df_model['M_Feat2_imp'] > self.df_model['M_Feat2_imp'].median()).astype(int), name="TargetC")
+        rng = np.random.default_rng(42) # Local generator: reproducible without touching global NumPy state
+        cls.target_reg = pd.Series(cls._m_feat2 * 2 + rng.normal(0, 0.1, 100), name="TargetR")
+        cls.target_clf = pd.Series( (cls.df_model['M_Feat2_imp'] > cls.df_model['M_Feat2_imp'].median()).astype(int), name="TargetC")
         # Introduce NaNs into target
-        self.target_reg_nan = self.target_reg.copy()
-        self.target_reg_nan.iloc[5:10] = np.nan
-        self.target_clf_nan = self.target_clf.copy()
-        self.target_clf_nan.iloc[10:15] = np.nan
+        cls.target_reg_nan = cls.target_reg.copy()
+        cls.target_reg_nan.iloc[5:10] = np.nan
+        cls.target_clf_nan = cls.target_clf.copy()
+        cls.target_clf_nan.iloc[10:15] = np.nan
+
+
+    def setUp(self):
+        """Set up for each test method."""
+        # Give every test its own log file so tests can run in parallel (pytest -n auto)
+        tmpdir = tempfile.TemporaryDirectory(prefix="autoeda_fs_log_")
+        self.addCleanup(tmpdir.cleanup)
+        self.log_file_path = os.path.join(tmpdir.name, "feature_selection_log.txt")
+        log_patcher = patch.object(feature_selector, 'log_file_path', self.log_file_path)
+        log_patcher.start()
+        self.addCleanup(log_patcher.stop)
 
 
     @classmethod
     def tearDownClass(cls):
         """Clean up after all tests in the class."""
-        if os.path.exists(cls.test_output_dir):
-            shutil.rmtree(cls.test_output_dir)
-        # Clean up the main log file if it was created by tests
-        if os.path.exists(cls.original_log_file_path) and "test" in cls.original_log_file_path: # safety
-             pass # Avoid deleting non-test main log unless specifically named for tests
-        elif os.path.exists(cls.original_log_file_path) and "output/feature_selection_log.txt" in cls.original_log_file_path:
-             # This is the actual log file, clear it if tests ran.
-             # In a real CI/CD, log handling would be more robust.
-             # For now, assume if tests ran, this log might contain test data.
-             # os.remove(cls.original_log_file_path) # Commented out to avoid accidental deletion of useful logs during manual runs
-             pass
+        cls._tmpdir_ctx.cleanup()
 
 
     def test_dummy(self): # A dummy test to ensure setup/teardown work
         self.assertTrue(True)
-        # Check if the main log file is created by module import or first logging call
-        # The module itself creates ./output/feature_selection_log.txt
-        # self.assertTrue(os.path.exists(self.original_log_file_path)) # Log is created on first write not import
+        # The per-test log is created on first write, not on import
+        self.assertFalse(os.path.exists(self.log_file_path))
+
+    def _check_cases(self, func, cases):
+        """Runs (name, df, threshold, expected) cases; expected=None means df is returned unchanged."""
+        for name, df, threshold, expected in cases:
+            with self.subTest(case=name):
+                df_result = func(df, threshold=threshold)
+                if expected is None:
+                    assert_frame_equal(df_result, df)
+                else:
+                    self.assertSetEqual(set(df_result.columns), expected)
 
     # --- Test remove_low_variance ---
-    def test_remove_low_variance_normal_case(self):
-        df_result = remove_low_variance(self.df_low_var_mixed.copy(), threshold=0.1)
-        self.assertListEqual(sorted(df_result.columns.tolist()), sorted(['A', 'D', 'E']))
-        self.assertTrue(os.path.exists(self.original_log_file_path)) # Check log was written to
-
-    def test_remove_low_variance_no_removal_threshold_zero(self):
-        # With threshold = 0, only features with variance < 0 are removed (none).
-        # So, all features should be kept, including those with variance == 0.
-        df_result = remove_low_variance(self.df_low_var_mixed.copy(), threshold=0.0)
-        self.assertListEqual(sorted(df_result.columns.tolist()), sorted(self.df_low_var_mixed.columns.tolist()))
-
-    def test_remove_low_variance_all_numeric_removed(self):
-        # Create a df where all numeric columns have low variance
+    def test_remove_low_variance_cases(self):
+        # Variances in df_low_var_mixed: A=2.5, B=0, C=0.007, D=250, E is non-numeric
         df_all_low = pd.DataFrame({'X': [1,1,1], 'Y': [2,2,2], 'Z_text':['a','b','c']})
-        df_result = remove_low_variance(df_all_low.copy(), threshold=0.1)
-        self.assertListEqual(sorted(df_result.columns.tolist()), sorted(['Z_text']))
-
-    def test_remove_low_variance_no_numeric(self):
-        df_result = remove_low_variance(self.df_no_numeric.copy(), threshold=0.1)
-        assert_frame_equal(df_result, self.df_no_numeric)
-
-    def test_remove_low_variance_empty_df(self):
-        df_result = remove_low_variance(self.df_empty.copy(), threshold=0.1)
-        assert_frame_equal(df_result, self.df_empty)
-
-    def test_remove_low_variance_strict_positive_threshold(self):
-        # B has 0 variance, C has 0.007.
-        # With threshold = 0.001, B (var 0) should be removed (0 < 0.001).
-        # C (var 0.007) should be kept (0.007 < 0.001 is false).
-        df_result = remove_low_variance(self.df_low_var_mixed.copy(), threshold=0.001)
-        self.assertListEqual(sorted(df_result.columns.tolist()), sorted(['A', 'C', 'D', 'E']))
+        cases = [
+            ("normal_case", self.df_low_var_mixed, 0.1, {'A', 'D', 'E'}),
+            # With threshold = 0, only features with variance < 0 are removed (none),
+            # so features with variance == 0 are kept too.
+            ("no_removal_threshold_zero", self.df_low_var_mixed, 0.0, set(self.df_low_var_mixed.columns)),
+            ("all_numeric_removed", df_all_low, 0.1, {'Z_text'}),
+            ("no_numeric", self.df_no_numeric, 0.1, None),
+            ("empty_df", self.df_empty, 0.1, None),
+            # B (var 0) is removed since 0 < 0.001; C (var 0.007) is kept.
+            ("strict_positive_threshold", self.df_low_var_mixed, 0.001, {'A', 'C', 'D', 'E'}),
+        ]
+        self._check_cases(remove_low_variance, cases)
+        self.assertTrue(os.path.exists(self.log_file_path)) # Check log was written to
 
     # --- Test remove_highly_correlated ---
-    def test_remove_highly_correlated_normal_case(self):
-        # Expected: F1 vs F0 -> F1 dropped (keeps F0)
-        # F2 vs F0 -> F2 dropped (keeps F0)
-        # F3 vs F0 -> F3 dropped (keeps F0)
-        # F2 vs F1 (F1 already dropped)
-        # Based on df_corr_mixed:
+    def test_remove_highly_correlated_cases(self):
+        # normal_case, based on df_corr_mixed:
         # Numeric columns: F0, F1, F2, F3, F4
         # Pairs (abs_corr > 0.9): (F0,F1), (F0,F2), (F0,F3), (F1,F2), (F1,F3), (F2,F3)
         # Iteration (col, idx):
@@ -169,56 +144,36 @@ class TestFeatureSelector(unittest.TestCase):
         # ('F2', 'F1'): F1,F2 already in dropped. Skip.
         # ('F3', 'F0'): corr > 0.9. 'F0' > 'F3' is False. Drop 'F3'. Kept: F0. Dropped: {F1, F2, F3}
         # So, F0, F4, F5_text should remain.
-        df_result = remove_highly_correlated(self.df_corr_mixed.copy(), threshold=0.9)
-        self.assertListEqual(sorted(df_result.columns.tolist()), sorted(['F0', 'F4', 'F5_text']))
-        self.assertTrue(os.path.exists(self.original_log_file_path))
-
-    def test_remove_highly_correlated_no_removal(self):
-        df_result = remove_highly_correlated(self.df_corr_mixed.copy(), threshold=0.99999) # Very high threshold
-        # F0, F1, F2, F3 are perfectly correlated if noise is 0. With noise, maybe not.
-        # F0 and F3 are perfectly negatively correlated. F0 and F1 are very highly correlated.
-        # (F1,F0) -> F1 dropped.
-        # (F2,F0) -> F2 dropped
-        # (F3,F0) -> F3 dropped.
-        # This means with threshold 0.99999 (assuming perfect correlation after np.linspace)
-        # still F0, F4, F5_text
-        # Let's make a less perfectly correlated df for this test.
+        #
+        # no_removal: df_corr_mixed is perfectly correlated, so a less correlated frame is used.
+        # corr(LC1, LC2) is around 0.99, below the 0.999 threshold.
         df_less_corr = pd.DataFrame({
             'LC1': [1,2,3,4,5], 'LC2': [1.5,2.5,3.5,4.8,5.2], 'LC3': ['a','b','c','d','e']
         })
-        df_result_lc = remove_highly_correlated(df_less_corr.copy(), threshold=0.95) # Corr is high but maybe not >0.95
-        # Correlation of LC1 and LC2 is likely high. Let's test with 0.98
-        # print(df_less_corr[['LC1','LC2']].corr()) # around 0.99
-        df_result_lc_no_removal = remove_highly_correlated(df_less_corr.copy(), threshold=0.999)
-        self.assertListEqual(sorted(df_result_lc_no_removal.columns.tolist()), sorted(df_less_corr.columns.tolist()))
-
-
-    def test_remove_highly_correlated_less_than_2_numeric(self):
         df_one_numeric = pd.DataFrame({'A': [1, 2, 3], 'B_text': ['x', 'y', 'z']})
-        df_result = remove_highly_correlated(df_one_numeric.copy(), threshold=0.8)
-        assert_frame_equal(df_result, df_one_numeric)
-
-    def test_remove_highly_correlated_no_numeric(self):
-        df_result = remove_highly_correlated(self.df_no_numeric.copy(), threshold=0.8)
-        assert_frame_equal(df_result, self.df_no_numeric)
-
-    def test_remove_highly_correlated_empty_df(self):
-        df_result = remove_highly_correlated(self.df_empty.copy(), threshold=0.8)
-        assert_frame_equal(df_result, self.df_empty)
+        cases = [
+            ("normal_case", self.df_corr_mixed, 0.9, {'F0', 'F4', 'F5_text'}),
+            ("no_removal", df_less_corr, 0.999, set(df_less_corr.columns)),
+            ("less_than_2_numeric", df_one_numeric, 0.8, None),
+            ("no_numeric", self.df_no_numeric, 0.8, None),
+            ("empty_df", self.df_empty, 0.8, None),
+        ]
+        self._check_cases(remove_highly_correlated, cases)
+        self.assertTrue(os.path.exists(self.log_file_path))
 
     # --- Test select_by_model_importance ---
     def test_sbm_regression_normal_case(self):
         # M_Feat3_zero_imp should be removed (or have importance near zero)
-        df_result = select_by_model_importance(self.df_model.copy(), self.target_reg.copy(), 'regression', threshold=0.01) # Lowered threshold
+        df_result = select_by_model_importance(self.df_model, self.target_reg, 'regression', threshold=0.01, n_estimators=self.n_estimators) # Lowered threshold
         self.assertNotIn('M_Feat3_zero_imp', df_result.columns)
         self.assertIn('M_Feat1', df_result.columns)
         self.assertIn('M_Feat2_imp', df_result.columns)
         self.assertIn('M_Feat4_text', df_result.columns) # Non-numeric kept
-        self.assertTrue(os.path.exists(self.original_log_file_path))
+        self.assertTrue(os.path.exists(self.log_file_path))
 
     def test_sbm_classification_normal_case(self):
         # M_Feat3_zero_imp should be removed
-        df_result = select_by_model_importance(self.df_model.copy(), self.target_clf.copy(), 'classification', threshold=0.01) # Lowered threshold
+        df_result = select_by_model_importance(self.df_model, self.target_clf, 'classification', threshold=0.01, n_estimators=self.n_estimators) # Lowered threshold
         self.assertNotIn('M_Feat3_zero_imp', df_result.columns)
         # M_Feat1 might be weak for classification target, its importance depends on data
         # self.assertIn('M_Feat1', df_result.columns) 
@@ -227,22 +182,19 @@ class TestFeatureSelector(unittest.TestCase):
 
     def test_sbm_regression_target_with_nans(self):
         # Test that rows with NaNs in target are dropped and model still runs
-        df_copy = self.df_model.copy()
-        target_copy = self.target_reg_nan.copy()
-        
-        # Align df_copy with target_copy before passing to function, as per function's expectation
+        # Align df_model with target_reg_nan before passing to function, as per function's expectation
         # The main run_feature_selection function does this alignment.
         # Here, we simulate it for direct unit test.
-        valid_indices = target_copy.dropna().index
-        df_aligned = df_copy.loc[valid_indices]
-        target_aligned = target_copy.loc[valid_indices]
+        valid_indices = self.target_reg_nan.dropna().index
+        df_aligned = self.df_model.loc[valid_indices]
+        target_aligned = self.target_reg_nan.loc[valid_indices]
 
-        df_result = select_by_model_importance(df_aligned, target_aligned, 'regression', threshold=0.01)
+        df_result = select_by_model_importance(df_aligned, target_aligned, 'regression', threshold=0.01, n_estimators=self.n_estimators)
         self.assertNotIn('M_Feat3_zero_imp', df_result.columns)
         self.assertEqual(df_result.shape[0], len(valid_indices)) # Check rows dropped
 
     def test_sbm_no_numeric_features(self):
-        df_result = select_by_model_importance(self.df_no_numeric.copy(), pd.Series([1,0,1]), 'classification', threshold=0.01)
+        df_result = select_by_model_importance(self.df_no_numeric, pd.Series([1,0,1]), 'classification', threshold=0.01, n_estimators=self.n_estimators)
         assert_frame_equal(df_result, self.df_no_numeric)
 
     def test_sbm_empty_df_after_target_nan_removal(self):
@@ -255,54 +207,70 @@ class TestFeatureSelector(unittest.TestCase):
         df_aligned = df_features.loc[valid_indices] # This will be empty
         target_aligned = target_all_nan.loc[valid_indices] # This will be empty
 
-        df_result = select_by_model_importance(df_aligned, target_aligned, 'regression', threshold=0.01)
+        df_result = select_by_model_importance(df_aligned, target_aligned, 'regression', threshold=0.01, n_estimators=self.n_estimators)
         self.assertTrue(df_result.empty) # Expect an empty df (or original structure)
 
     def test_sbm_input_df_empty(self):
-        df_result = select_by_model_importance(self.df_empty.copy(), pd.Series([]), 'classification', threshold=0.01)
+        df_result = select_by_model_importance(self.df_empty, pd.Series([]), 'classification', threshold=0.01, n_estimators=self.n_estimators)
         self.assertTrue(df_result.empty)
 
 
+    def test_inputs_not_mutated(self):
+        # Shared fixtures are passed without .copy(), so the functions must leave them intact
+        df_before = self.df_model.copy()
+        target_before = self.target_reg.copy()
+        remove_low_variance(self.df_model, threshold=0.1)
+        remove_highly_correlated(self.df_model, threshold=0.9)
+        select_by_model_importance(self.df_model, self.target_reg, 'regression', threshold=0.01, n_estimators=self.n_estimators)
+        assert_frame_equal(self.df_model, df_before)
+        assert_series_equal(self.target_reg, target_before)
+
     # --- Test run_feature_selection (Integration) ---
+    def _run_feature_selection_in_memory(self, input_df, *args, **kwargs):
+        """Runs run_feature_selection with CSV I/O patched out; returns the DataFrame it saved."""
+        written = {}
+
+        def capture_to_csv(df_self, path, *csv_args, **csv_kwargs):
+            written[path] = df_self
+
+        with patch('autoeda.feature_selector.pd.read_csv', return_value=input_df), \
+             patch.object(pd.DataFrame, 'to_csv', autospec=True, side_effect=capture_to_csv):
+            run_feature_selection("test_input.csv", "test_output.csv", *args, **kwargs)
+        return written.get("test_output.csv")
+
     def test_run_feature_selection_regression(self):
-        input_csv = os.path.join(self.test_output_dir, "test_input_reg.csv")
-        output_csv = os.path.join(self.test_output_dir, "test_output_reg.csv")
-        
-        # Create a sample CSV for regression
-        test_df_reg = self.df_model.copy()
-        test_df_reg['TargetR'] = self.target_reg_nan.copy() # Has NaNs
-        test_df_reg.to_csv(input_csv, index=False)
-
-        run_feature_selection(input_csv, output_csv, 'TargetR', 'regression', 
-                              low_variance_threshold=0.0, # M_Feat3_zero_imp has var 0. threshold=0 won't remove it here.
-                                                           # It should be removed by model importance.
-                              correlation_threshold=0.95, 
-                              importance_threshold=0.01) # M_Feat3_zero_imp should be removed by this
-        
-        self.assertTrue(os.path.exists(output_csv))
-        self.assertTrue(os.path.exists(self.original_log_file_path))
-        df_out = pd.read_csv(output_csv)
+        # Sample input for regression
+        test_df_reg = self.df_model.copy() # Copied because the target column is added below
+        test_df_reg['TargetR'] = self.target_reg_nan # Has NaNs
+
+        df_out = self._run_feature_selection_in_memory(
+            test_df_reg, 'TargetR', 'regression',
+            low_variance_threshold=0.0, # M_Feat3_zero_imp has var 0. threshold=0 won't remove it here.
+                                        # It should be removed by model importance.
+            correlation_threshold=0.95,
+            importance_threshold=0.01, # M_Feat3_zero_imp should be removed by this
+            n_estimators=self.n_estimators)
+
+        self.assertIsNotNone(df_out)
+        self.assertTrue(os.path.exists(self.log_file_path))
         self.assertIn('TargetR', df_out.columns)
         self.assertNotIn('M_Feat3_zero_imp', df_out.columns) 
         self.assertLessEqual(df_out.shape[1], test_df_reg.shape[1]) 
         self.assertEqual(df_out.shape[0], test_df_reg.shape[0] - self.target_reg_nan.isnull().sum())
 
     def test_run_feature_selection_classification(self):
-        input_csv = os.path.join(self.test_output_dir, "test_input_clf.csv")
-        output_csv = os.path.join(self.test_output_dir, "test_output_clf.csv")
-
         test_df_clf = self.df_model.copy()
-        test_df_clf['TargetC'] = self.target_clf_nan.copy() # Has NaNs
-        test_df_clf.to_csv(input_csv, index=False)
+        test_df_clf['TargetC'] = self.target_clf_nan # Has NaNs
 
-        run_feature_selection(input_csv, output_csv, 'TargetC', 'classification',
-                              low_variance_threshold=0.0, 
-                              correlation_threshold=0.95,
-                              importance_threshold=0.01)
-        
-        self.assertTrue(os.path.exists(output_csv))
-        self.assertTrue(os.path.exists(self.original_log_file_path))
-        df_out = pd.read_csv(output_csv)
+        df_out = self._run_feature_selection_in_memory(
+            test_df_clf, 'TargetC', 'classification',
+            low_variance_threshold=0.0,
+            correlation_threshold=0.95,
+            importance_threshold=0.01,
+            n_estimators=self.n_estimators)
+
+        self.assertIsNotNone(df_out)
+        self.assertTrue(os.path.exists(self.log_file_path))
         self.assertIn('TargetC', df_out.columns)
         self.assertNotIn('M_Feat3_zero_imp', df_out.columns)
         self.assertLessEqual(df_out.shape[1], test_df_clf.shape[1])
@@ -5,36 +5,44 @@ import pandas as pd
 import numpy as np
 from autoeda.pca_transformer import apply_pca  # Adjust path if needed
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def dummy_df():
     """Fixture to provide a reproducible dummy DataFrame with numeric features."""
-    np.random.seed(42)
-    return pd.DataFrame({
-        "feature1": np.random.rand(10),
-        "feature2": np.random.rand(10),
-        "feature3": np.random.rand(10)
-    })
-
-def test_standard_pca_shape(dummy_df):
+    rng = np.random.default_rng(42)
+    arr = rng.random((10, 3), dtype=np.float32)
+    return pd.DataFrame(arr, columns=["feature1", "feature2", "feature3"])
+
+@pytest.fixture(scope="module")
+def pca_default(dummy_df):
+    """Result of apply_pca with default components, fitted once and shared (apply_pca does not modify its input)."""
+    return apply_pca(dummy_df)
+
+def test_standard_pca_shape(dummy_df, pca_default):
     """Test that PCA returns the correct shape when all components are used."""
-    transformed_df, meta = apply_pca(dummy_df)
+    transformed_df, meta = pca_default
     assert transformed_df.shape == dummy_df.shape
     assert meta["n_components"] == dummy_df.shape[1]
 
-def test_metadata_integrity(dummy_df):
+def test_metadata_integrity(dummy_df, pca_default):
     """Check that the metadata dictionary contains accurate and expected fields."""
-    _, meta = apply_pca(dummy_df)
+    _, meta = pca_default
     assert "explained_variance_ratio" in meta
     assert isinstance(meta["explained_variance_ratio"], list)
     assert len(meta["explained_variance_ratio"]) == dummy_df.shape[1]
     assert meta["original_columns"] == ["feature1", "feature2", "feature3"]
     assert meta["pca_columns"] == [f"PC{i+1}" for i in range(dummy_df.shape[1])]
 
-def test_variance_sum_close_to_1(dummy_df):
+def test_variance_sum_close_to_1(pca_default):
     """Verify that the total explained variance is approximately 1 for full components."""
-    _, meta = apply_pca(dummy_df)
+    _, meta = pca_default
     total_variance = sum(meta["explained_variance_ratio"])
-    assert np.isclose(total_variance, 1.0, atol=1e-5)
+    assert np.isclose(total_variance, 1.0, atol=1e-4)  # float32 input
+
+def test_float32_input_kept(dummy_df, pca_default):
+    """Check that float32 columns are used by PCA and not upcast in the output."""
+    transformed_df, meta = pca_default
+    assert meta["original_columns"] == dummy_df.columns.tolist()
+    assert (transformed_df.dtypes == np.float32).all()
 
 def test_reduced_components(dummy_df):
     """Test PCA with fewer components than total features."""